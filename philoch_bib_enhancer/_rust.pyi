@@ -5,19 +5,21 @@ This module provides high-performance Rust implementations for:
 - Batch fuzzy scoring of bibliographic items
 """
 
-from typing import TypedDict
+from typing import Sequence, TypedDict
 
 # === Index Building Types ===
 
-class ItemData(TypedDict):
-    """Input data for a single bibliographic item (for index building)."""
+class ItemColumns(TypedDict):
+    """Input data for all bibliographic items, one list per field (for index building).
 
-    item_index: int
-    doi: str | None
-    title: str
-    author_surnames: list[str]
-    year: int | None
-    journal_name: str | None
+    Row i of every list describes the item at position i; all lists have the same length.
+    """
+
+    doi: list[str | None]
+    title: list[str]
+    author_surnames: list[list[str]]
+    year: list[int | None]
+    journal_name: list[str | None]
 
 class IndexData:
     """Output index data structure from build_index_rust."""
@@ -28,14 +30,17 @@ class IndexData:
     decade_to_indices: dict[int | None, list[int]]
     journal_to_indices: dict[str, list[int]]
 
-def build_index_rust(items_data: list[ItemData]) -> IndexData:
+def build_index_rust(items: ItemColumns) -> IndexData:
     """Build index for fuzzy matching.
 
     Args:
-        items_data: List of ItemData dicts with bibliographic info
+        items: ItemColumns with bibliographic info, one list per field
 
     Returns:
         IndexData with all indexes built for fast lookup
+
+    Raises:
+        ValueError: If the columns have different lengths
     """
     ...
 
@@ -107,9 +112,18 @@ class BlockingIndexData(TypedDict):
     """Blocking index data for efficient candidate filtering in Rust."""
 
     doi_index: dict[str, int]
-    trigram_index: dict[str, list[int]]
-    surname_index: dict[str, list[int]]
-    decade_index: dict[int, list[int]]
+    trigram_index: dict[str, Sequence[int]]
+    surname_index: dict[str, Sequence[int]]
+    decade_index: dict[int, Sequence[int]]
+
+class CandidateCorpus:
+    """Candidates and blocking index prepared once for repeated scoring.
+
+    Normalized candidate fields are computed at construction and kept in Rust memory.
+    """
+
+    def __init__(self, candidates: list[BibItemData], index: BlockingIndexData) -> None: ...
+    def __len__(self) -> int: ...
 
 def score_batch(
     subjects: list[BibItemData],
@@ -157,3 +171,51 @@ def score_batch_indexed(
         List of results, one per subject, containing top matches
     """
     ...
+
+def score_batch_corpus(
+    subjects: list[BibItemData],
+    corpus: CandidateCorpus,
+    top_n: int,
+    min_score: float,
+    weights: Weights,
+) -> list[SubjectMatchResult]:
+    """Batch score against a prepared candidate corpus.
+
+    Same results as score_batch_indexed, without re-converting the candidates on every call.
+
+    Args:
+        subjects: List of BibItems to find matches for
+        corpus: CandidateCorpus built from all candidates and the blocking index
+        top_n: Maximum number of matches to return per subject
+        min_score: Minimum score threshold for matches
+        weights: Dict with title, author, date, bonus weight floats
+
+    Returns:
+        List of results, one per subject, containing top matches
+    """
+    ...
+
+def score_batch_corpus_sweep(
+    subjects: list[BibItemData],
+    corpus: CandidateCorpus,
+    top_n: int,
+    min_score: float,
+    weights: list[Weights],
+) -> list[list[SubjectMatchResult]]:
+    """Batch score against a prepared candidate corpus for several weight configurations at once.
+
+    Each candidate is scored once and reweighted per configuration, so sweeping many
+    configurations costs a single scoring pass.
+
+    Args:
+        subjects: List of BibItems to find matches for
+        corpus: CandidateCorpus built from all candidates and the blocking index
+        top_n: Maximum number of matches to return per subject
+        min_score: Minimum score threshold for matches
+        weights: Weight configurations to rank the candidates under
+
+    Returns:
+        One list of per-subject results for each weight configuration, in the order given,
+        each equal to what score_batch_corpus returns for those weights
+    """
+    ...
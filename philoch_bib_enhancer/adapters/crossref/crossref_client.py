@@ -2,7 +2,16 @@ import logging
 from time import sleep
 from typing import TypedDict
 
+import requests
 from habanero import Crossref
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+CROSSREF_API_URL = "https://api.crossref.org"
+
+# (connect, read) timeouts in seconds for session requests
+CROSSREF_TIMEOUT = (5, 30)
 
 
 class CrossrefJournalMessage(TypedDict):
@@ -29,6 +38,7 @@ class CrossrefClient:
         self._email = email
         self.logger = logging.getLogger(self.__class__.__name__)
         self._client = self._get_client()
+        self._session = self._get_session()
 
         is_up = self.ping()
         if not is_up:
@@ -50,6 +60,22 @@ class CrossrefClient:
         )
         return client
 
+    def _get_session(self) -> requests.Session:  # type: ignore[no-any-unimported]  # requests is untyped
+        """
+        Persistent HTTP session: keeps the TLS connection alive across requests,
+        and retries with exponential backoff on rate limiting and server errors.
+        """
+        retries = Retry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=("GET",),
+        )
+        session = requests.Session()
+        session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=16, max_retries=retries))
+        session.headers.update({"User-Agent": f"philoch-bib-enhancer (mailto:{self.email})"})
+        return session
+
     def ping(self) -> bool:
         """
         Check if Crossref is up and running.
@@ -79,16 +105,21 @@ class CrossrefClient:
     def journal_articles_by_issn_year(self, issn: str, year: int) -> CrossrefArticlesResponse:
         """
         Get the articles of a journal by its ISSN and a year.
+
+        Goes through the persistent session (keep-alive + retries) rather than
+        habanero, since this is called once per year of the scraped range.
         """
-        response: CrossrefArticlesResponse = self.raw_client.journals(
-            ids=issn,
-            works=True,
-            filter={
-                "from-pub-date": f"{year}-01-01",
-                "until-pub-date": f"{year}-12-31",
+        http_response = self._session.get(
+            f"{CROSSREF_API_URL}/journals/{issn}/works",
+            params={
+                "filter": f"from-pub-date:{year}-01-01,until-pub-date:{year}-12-31",
+                "rows": 1000,
+                "mailto": self.email,
             },
-            limit=1000,
+            timeout=CROSSREF_TIMEOUT,
         )
+        http_response.raise_for_status()
+        response: CrossrefArticlesResponse = http_response.json()
 
         sleep(0.1)
 
@@ -7,6 +7,23 @@ from typing import List
 from philoch_bib_enhancer.cli.manual_raw_text_to_csv import process_raw_bibitems
 from philoch_bib_enhancer.adapters.raw_text.raw_text_models import RawTextAuthor, RawTextBibitem
 
+# Map BibTeX types to standard types
+_ENTRY_TYPE_MAPPING = {
+    'article': 'article',
+    'book': 'book',
+    'incollection': 'incollection',
+    'inbook': 'incollection',
+    'mastersthesis': 'mastersthesis',
+    'phdthesis': 'phdthesis',
+    'thesis': 'thesis',
+    'inproceedings': 'inproceedings',
+    'conference': 'inproceedings',
+}
+
+# Lowercased year values that denote a publication state or a missing date
+_FORTHCOMING_YEARS = frozenset({'forthcoming', 'in press', 'inpress'})
+_NO_DATE_YEARS = frozenset({'no date', 'n.d.'})
+
 
 def parse_bib_file(file_path: str) -> List[RawTextBibitem]:
     """Parse a BibTeX file and extract all entries as RawTextBibitem objects."""
@@ -43,19 +60,7 @@ def parse_entry(entry: str) -> RawTextBibitem | None:
     entry_type = type_match.group(1).lower()  # Gets just "article", not "@article"
 
     # Map BibTeX types to standard types
-    type_mapping = {
-        'article': 'article',
-        'book': 'book',
-        'incollection': 'incollection',
-        'inbook': 'incollection',
-        'mastersthesis': 'mastersthesis',
-        'phdthesis': 'phdthesis',
-        'thesis': 'thesis',
-        'inproceedings': 'inproceedings',
-        'conference': 'inproceedings',
-    }
-
-    normalized_type = type_mapping.get(entry_type, entry_type)
+    normalized_type = _ENTRY_TYPE_MAPPING.get(entry_type, entry_type)
 
     # Extract fields
     title = extract_field(entry, 'title')
@@ -71,9 +76,9 @@ def parse_entry(entry: str) -> RawTextBibitem | None:
         year_lower = year_str.lower()
 
         # Check if it's a publication state
-        if year_lower in ['forthcoming', 'in press', 'inpress']:
+        if year_lower in _FORTHCOMING_YEARS:
             pubstate = 'forthcoming'
-        elif year_lower in ['no date', 'n.d.']:
+        elif year_lower in _NO_DATE_YEARS:
             # "no date" is not a pubstate, just leave year as None
             pass
         elif year_str.isdigit():
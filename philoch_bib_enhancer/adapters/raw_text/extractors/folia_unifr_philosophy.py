@@ -278,10 +278,12 @@ if bibitems:
     print(f"\n✓ Complete! CSV saved to: {output_path}")
     print(f"  Total records: {len(bibitems)}")
 
-    # Summary statistics
-    with_authors = sum(1 for b in bibitems if b.authors)
-    with_doi = sum(1 for b in bibitems if b.doi)
-    with_journal = sum(1 for b in bibitems if b.journal)
+    # Summary statistics, counted in a single pass
+    with_authors = with_doi = with_journal = 0
+    for b in bibitems:
+        with_authors += bool(b.authors)
+        with_doi += bool(b.doi)
+        with_journal += bool(b.journal)
 
     print(f"\nMetadata coverage:")
     print(f"  - With authors: {with_authors}/{len(bibitems)}")
@@ -9,21 +9,16 @@ Specifically implements journal scraping using the Crossref API adapter.
 """
 
 import os
-import csv
 import argparse
-from typing import Iterable
 from dotenv import load_dotenv
 
 from aletk.utils import get_logger, lginf, remove_extra_whitespace
 from pydantic import BaseModel
-from philoch_bib_sdk.logic.models import BibItem
-from philoch_bib_sdk.converters.plaintext.bibitem.formatter import format_bibitem, FormattedBibItem
-from philoch_bib_sdk.adapters.tabular_data.read_journal_volume_number_index import ColumnNames, hof_read_from_ods
+from philoch_bib_sdk.adapters.tabular_data.read_journal_volume_number_index import ColumnNames
 
 from philoch_bib_enhancer.adapters.crossref.crossref_client import CrossrefClient
 from philoch_bib_enhancer.adapters.crossref import crossref_bibitem_gateway
-from philoch_bib_enhancer.domain.bibkey_matching import match_bibkey_to_article
-from philoch_bib_enhancer.domain.parsing_result import ParsedResult
+from philoch_bib_enhancer.cli.journal_scraping_io import write_articles_to_csv, create_bibkey_matcher
 from philoch_bib_enhancer.ports.journal_scraping import (
     main,
     JournalScraperMainIN,
@@ -77,75 +72,6 @@ def setup_crossref_client(v: InitConfig) -> CrossrefClient:
     return CrossrefClient(email=v.CROSSREF_EMAIL)
 
 
-# ============================================================================
-# Concrete Implementations (Imperative)
-# ============================================================================
-
-
-def write_articles_to_csv(
-    articles: Iterable[ParsedResult[BibItem]],
-    output_path: str,
-) -> None:
-    """
-    Concrete CSV writer implementation.
-
-    Imperative implementation is fine here - it's clear, straightforward,
-    and easy to maintain.
-    """
-    flat_res = (
-        {
-            **(
-                format_bibitem(parsed["out"])
-                if parsed["parsing_status"] == "success"
-                else {k: "" for k in FormattedBibItem.__required_keys__}
-            ),
-            "parsing_status": parsed["parsing_status"],
-            "message": parsed.get("message", ""),
-            "context": parsed.get("context", ""),
-        }
-        for parsed in articles
-    )
-
-    with open(output_path, "w", newline="", encoding="utf-8") as csvfile:
-        first = next(flat_res, None)
-        if first is None:
-            lgr.warning("No articles found for the given ISSN and year range.")
-            return
-
-        fieldnames = list(first.keys())
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerow(first)
-        for row in flat_res:
-            writer.writerow(row)
-
-
-def create_bibkey_matcher(
-    bibliography_path: str,
-    column_names: ColumnNames,
-) -> TBibkeyMatcher:
-    """
-    Create a bibkey matcher function by loading an ODS index.
-
-    Imperative implementation: loads file, creates closure over index.
-    """
-    lgr.info(f"Loading bibkey index from {bibliography_path}...")
-    index = hof_read_from_ods(column_names)(bibliography_path)
-    lgr.info(f"Index loaded with {len(index)} entries.")
-
-    # Return a matcher function (closure over index)
-    def matcher(parsed: ParsedResult[BibItem]) -> ParsedResult[BibItem]:
-        result = match_bibkey_to_article(index, parsed)
-        # Log only if bibkey was not found (optional logging in shell)
-        if result["parsing_status"] == "success":
-            bibitem = result["out"]
-            if not bibitem.bibkey and parsed["parsing_status"] == "success":
-                lgr.warning(f"Bibkey not found for: {bibitem.journal}, vol {bibitem.volume}, num {bibitem.number}")
-        return result
-
-    return matcher
-
-
 # ============================================================================
 # CLI Argument Parsing
 # ============================================================================
@@ -219,6 +145,13 @@ def parse_args() -> argparse.Namespace:
         required=False,
     )
 
+    parser.add_argument(
+        "--gzip",
+        "-z",
+        action="store_true",
+        help="Gzip-compress the output CSV (written as <ISSN>_articles.csv.gz).",
+    )
+
     return parser.parse_args()
 
 
@@ -245,7 +178,6 @@ def cli() -> None:
     issn = args.issn
     year_range = (args.start_year, args.end_year)
 
-    journal_scraper_in: JournalScraperIN
     bibkey_matching_config = None
 
     if args.bibliography_path:
@@ -268,16 +200,12 @@ def cli() -> None:
             column_names=column_names,
         )
 
-        journal_scraper_in = JournalScraperIN(
-            issn=issn,
-            year_range=year_range,
-            with_bibkey_matching=bibkey_matching_config,
-        )
-    else:
-        journal_scraper_in = JournalScraperIN(
-            issn=issn,
-            year_range=year_range,
-        )
+    # Argparse already typed the values; only the cheap ISSN check is re-run
+    journal_scraper_in = JournalScraperIN.model_construct_validated(
+        issn=issn,
+        year_range=year_range,
+        with_bibkey_matching=bibkey_matching_config,
+    )
 
     # === SETUP INFRASTRUCTURE (Imperative) ===
     env_config = load_env_vars()
@@ -308,6 +236,7 @@ def cli() -> None:
         match_bibkey=bibkey_matcher,
         write_articles=write_articles_to_csv,
         output_dir=output_dir,
+        gzip_output=args.gzip,
     )
 
     main(main_in)
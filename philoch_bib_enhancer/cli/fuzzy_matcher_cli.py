@@ -107,7 +107,11 @@ BIBLIOGRAPHY_COLUMNS = [
 
 
 def _get_str(attr: BibStringAttr | str | None) -> str:
-    """Helper to extract string from BibStringAttr or return empty string."""
+    """Helper to extract string from BibStringAttr or return empty string.
+
+    Deliberately uncached: this is a single attribute read, cheaper than an lru_cache lookup,
+    and repeated citations are already memoized per entry by cache_plaintext_citations.
+    """
     if isinstance(attr, BibStringAttr):
         return attr.simplified
     return str(attr) if attr else ""
@@ -216,6 +220,21 @@ def load_bibliography_as_dict(file_path: Path) -> dict[str, BibItem]:
     return result.out
 
 
+def cache_plaintext_citations(
+    staged_item: BibItemStaged,
+    plaintext_citations: dict[str, str],
+    top_n: int,
+) -> None:
+    """Add citations for the item's top matches that are not in plaintext_citations yet.
+
+    Citations are built on demand, once per matched bibliography entry, instead of for the whole
+    bibliography up front.
+    """
+    for match in staged_item.top_matches[:top_n]:
+        if match.bibkey not in plaintext_citations:
+            plaintext_citations[match.bibkey] = build_plaintext_citation(match.matched_bibitem)
+
+
 def build_output_row(
     input_row: dict[str, str],
     staged_item: BibItemStaged,
@@ -410,10 +429,8 @@ def cli() -> None:
     index = build_index_cached(bibliography, cache_path=cache_path, force_rebuild=args.force_rebuild)
     lginf(frame, f"Index ready in {time.perf_counter() - start:.1f}s", lgr)
 
-    # === BUILD PLAINTEXT CITATION LOOKUP ===
+    # === PLAINTEXT CITATION LOOKUP (filled on demand for matched entries) ===
     plaintext_citations: dict[str, str] = {}
-    for bibkey, bibitem in bibliography_dict.items():
-        plaintext_citations[bibkey] = build_plaintext_citation(bibitem)
 
     # === RUN FUZZY MATCHING (STREAMING) ===
     total = len(subjects)
@@ -437,12 +454,13 @@ def cli() -> None:
                 weights=weights,
             )
         ):
+            cache_plaintext_citations(staged_item, plaintext_citations, args.top_n)
             output_row = build_output_row(input_rows[i], staged_item, plaintext_citations, args.top_n)
             writer.writerow(output_row)
-            f.flush()  # Ensure immediate write to disk for tail -f
 
-            # Progress logging every 10 items
+            # Flush and log progress every 10 items (rows arrive in scoring batches, so tail -f stays current)
             if (i + 1) % 10 == 0 or (i + 1) == total:
+                f.flush()
                 elapsed = time.perf_counter() - start
                 rate = (i + 1) / elapsed if elapsed > 0 else 0
                 lginf(frame, f"Processed {i + 1}/{total} items ({rate:.1f} items/s)", lgr)
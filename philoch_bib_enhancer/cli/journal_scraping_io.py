@@ -0,0 +1,175 @@
+"""
+Concrete I/O implementations shared by the journal scraping CLIs.
+
+Gateway-agnostic: the Crossref and RawText CLIs all write articles and match
+bibkeys the same way, so these live here rather than in any one CLI. Keeping
+them apart from the gateway CLIs means importing them doesn't pull in
+habanero, the Crossref client or any gateway configuration models.
+"""
+
+import os
+import re
+import csv
+import gzip
+import mmap
+import pickle
+import hashlib
+import tempfile
+from pathlib import Path
+from typing import Iterable, TextIO
+
+from aletk.utils import get_logger
+from philoch_bib_sdk.logic.models import BibItem
+from philoch_bib_sdk.converters.plaintext.bibitem.formatter import format_bibitem, FormattedBibItem
+from philoch_bib_sdk.adapters.tabular_data.read_journal_volume_number_index import ColumnNames, hof_read_from_ods
+from philoch_bib_sdk.logic.functions.journal_article_matcher import TJournalBibkeyIndex
+
+from philoch_bib_enhancer.domain.bibkey_matching import match_bibkey_to_article
+from philoch_bib_enhancer.domain.parsing_result import ParsedResult
+from philoch_bib_enhancer.ports.journal_scraping import TBibkeyMatcher
+
+lgr = get_logger(__file__)
+
+DEFAULT_INDEX_CACHE_DIR = "data/cache"
+
+# Level 3 keeps gzip well ahead of the network-bound scrape while still shrinking CSVs several-fold
+GZIP_COMPRESSLEVEL = 3
+
+
+# ============================================================================
+# Concrete Implementations (Imperative)
+# ============================================================================
+
+
+def write_articles_to_csv(
+    articles: Iterable[ParsedResult[BibItem]],
+    output_path: str,
+) -> None:
+    """
+    Concrete CSV writer implementation.
+
+    Imperative implementation is fine here - it's clear, straightforward,
+    and easy to maintain. Paths ending in `.gz` are gzip-compressed on the fly.
+    """
+    # Bind once so the per-row generator body only touches locals
+    fmt = format_bibitem
+    empty_formatted = dict.fromkeys(FormattedBibItem.__required_keys__, "")
+
+    flat_res = (
+        {
+            **(fmt(parsed["out"]) if parsed["parsing_status"] == "success" else empty_formatted),
+            "parsing_status": parsed["parsing_status"],
+            "message": parsed.get("message", ""),
+            "context": parsed.get("context", ""),
+        }
+        for parsed in articles
+    )
+
+    csvfile: TextIO
+    if output_path.endswith(".gz"):
+        csvfile = gzip.open(output_path, "wt", newline="", encoding="utf-8", compresslevel=GZIP_COMPRESSLEVEL)
+    else:
+        csvfile = open(output_path, "w", newline="", encoding="utf-8")
+
+    with csvfile:
+        writer: csv.DictWriter[str] | None = None
+        for row in flat_res:
+            if writer is None:
+                # Header comes from the first row's keys
+                writer = csv.DictWriter(csvfile, fieldnames=list(row))
+                writer.writeheader()
+            writer.writerow(row)
+
+    if writer is None:
+        lgr.warning("No articles found for the given ISSN and year range.")
+
+
+def _index_cache_path(bibliography_path: str, column_names: ColumnNames) -> Path:
+    """
+    Cache file for a bibkey index, keyed by bibliography path, mtime and column names.
+
+    Editing the bibliography (new mtime) or changing the column configuration
+    yields a new key, so stale caches are never picked up.
+    """
+    key_source = f"{os.path.abspath(bibliography_path)}:{os.path.getmtime(bibliography_path)}:{column_names}"
+    key = hashlib.blake2b(key_source.encode("utf-8"), digest_size=16).hexdigest()
+    cache_dir = Path(os.getenv("SCRAPE_JOURNAL_CACHE_DIR", DEFAULT_INDEX_CACHE_DIR))
+    return cache_dir / f"{Path(bibliography_path).stem}-{key}.pkl"
+
+
+def _write_index_cache(cache_path: Path, index: TJournalBibkeyIndex) -> None:
+    """
+    Atomically write a pickled bibkey index and remove caches of older bibliography versions.
+
+    The index is written to a temporary file in the cache directory and moved into place,
+    so readers never see a partial file. A failed write only costs the next run a re-parse,
+    so it is logged instead of raised.
+    """
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=cache_path.parent, prefix=f"{cache_path.stem}-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(index, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_name, cache_path)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+
+        # Same bibliography stem, other mtime or column names: superseded by the file just written
+        stale_name = re.compile(rf"{re.escape(cache_path.stem.rsplit('-', 1)[0])}-[0-9a-f]{{32}}\.pkl")
+        for sibling in cache_path.parent.iterdir():
+            if sibling != cache_path and stale_name.fullmatch(sibling.name):
+                sibling.unlink(missing_ok=True)
+    except OSError as e:
+        lgr.warning(f"Could not write bibkey index cache {cache_path} ({e.__class__.__name__}: {e}).")
+
+
+def _load_index_cached(bibliography_path: str, column_names: ColumnNames) -> TJournalBibkeyIndex:
+    """
+    Load the (journal, volume, number) -> bibkey index, parsing the ODS only on a cache miss.
+
+    Warm runs read the pickled index through a read-only mmap instead of
+    re-parsing the ODS file. Unreadable cache files are ignored and rebuilt.
+    """
+    cache_path = _index_cache_path(bibliography_path, column_names)
+
+    if cache_path.exists():
+        try:
+            with open(cache_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                cached: TJournalBibkeyIndex = pickle.load(mm)
+            lgr.info(f"Loaded cached bibkey index from {cache_path}.")
+            return cached
+        except (OSError, ValueError, pickle.UnpicklingError, EOFError) as e:
+            lgr.warning(f"Could not load cached bibkey index {cache_path} ({e.__class__.__name__}: {e}). Rebuilding.")
+
+    index = hof_read_from_ods(column_names)(bibliography_path)
+    _write_index_cache(cache_path, index)
+
+    return index
+
+
+def create_bibkey_matcher(
+    bibliography_path: str,
+    column_names: ColumnNames,
+) -> TBibkeyMatcher:
+    """
+    Create a bibkey matcher function by loading an ODS index.
+
+    Imperative implementation: loads file (or its cached index), creates closure over index.
+    """
+    lgr.info(f"Loading bibkey index from {bibliography_path}...")
+    index = _load_index_cached(bibliography_path, column_names)
+    lgr.info(f"Index loaded with {len(index)} entries.")
+
+    # Return a matcher function (closure over index)
+    def matcher(parsed: ParsedResult[BibItem]) -> ParsedResult[BibItem]:
+        result = match_bibkey_to_article(index, parsed)
+        # Log only if bibkey was not found (optional logging in shell)
+        if result["parsing_status"] == "success":
+            bibitem = result["out"]
+            if not bibitem.bibkey and parsed["parsing_status"] == "success":
+                lgr.warning(f"Bibkey not found for: {bibitem.journal}, vol {bibitem.volume}, num {bibitem.number}")
+        return result
+
+    return matcher
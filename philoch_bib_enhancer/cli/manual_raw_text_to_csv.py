@@ -47,8 +47,7 @@ from philoch_bib_enhancer.adapters.raw_text.raw_text_models import RawTextBibite
 from philoch_bib_enhancer.adapters.raw_text.raw_text_converter import convert_raw_text_to_bibitem
 from philoch_bib_enhancer.domain.parsing_result import ParsedResult
 
-# Reuse CSV writer from Crossref CLI
-from philoch_bib_enhancer.cli.crossref_journal_scraping_cli import (
+from philoch_bib_enhancer.cli.journal_scraping_io import (
     write_articles_to_csv,
     create_bibkey_matcher,
 )
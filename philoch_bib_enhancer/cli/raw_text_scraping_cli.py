@@ -19,8 +19,7 @@ from philoch_bib_sdk.adapters.tabular_data.read_journal_volume_number_index impo
 from philoch_bib_enhancer.adapters.raw_text import raw_text_gateway
 from philoch_bib_enhancer.ports.llm_service import LLMService
 
-# Reuse CSV writer from Crossref CLI
-from philoch_bib_enhancer.cli.crossref_journal_scraping_cli import (
+from philoch_bib_enhancer.cli.journal_scraping_io import (
     write_articles_to_csv,
     create_bibkey_matcher,
 )
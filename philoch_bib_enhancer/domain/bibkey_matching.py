@@ -5,16 +5,41 @@ This module contains pure functions with no I/O, no logging, and no side effects
 All functions are deterministic and testable.
 """
 
+import operator
+
 import attrs
 from philoch_bib_sdk.logic.functions.journal_article_matcher import (
     TJournalBibkeyIndex,
     get_bibkey_by_journal_volume_number,
 )
-from philoch_bib_sdk.logic.models import BibItem
+from philoch_bib_sdk.logic.models import BibItem, BibKeyAttr
 
 from philoch_bib_enhancer.domain.parsing_result import ParsedResult, is_parsing_success
 
 
+# BibItem field layout, resolved once at import instead of on every evolve
+_BIBITEM_INIT_FIELDS = tuple(f for f in attrs.fields(BibItem) if f.init)
+_BIBITEM_INIT_ALIASES = tuple(f.alias for f in _BIBITEM_INIT_FIELDS)
+_get_bibitem_values = operator.attrgetter(*(f.name for f in _BIBITEM_INIT_FIELDS))
+
+
+def _evolve_bibkey(bibitem: BibItem, bibkey: BibKeyAttr) -> BibItem:
+    """
+    Pure function: copy of a BibItem with only its bibkey replaced.
+
+    Equivalent to attrs.evolve(bibitem, bibkey=bibkey), but reads all field
+    values with a single prebuilt attrgetter instead of introspecting the
+    class fields per call.
+
+    :param bibitem: The BibItem to copy
+    :param bibkey: The new bibkey
+    :return: A new BibItem with the given bibkey
+    """
+    init_kwargs = dict(zip(_BIBITEM_INIT_ALIASES, _get_bibitem_values(bibitem)))
+    init_kwargs["bibkey"] = bibkey
+    return BibItem(**init_kwargs)
+
+
 def match_bibkey_to_article(
     index: TJournalBibkeyIndex,
     parsed_result: ParsedResult[BibItem],
@@ -27,7 +52,7 @@ def match_bibkey_to_article(
     the bibkey field populated. If not found or if there's an error, returns
     the article unchanged.
 
-    No side effects: no I/O, no logging, no mutations (uses attrs.evolve).
+    No side effects: no I/O, no logging, no mutations (copies via _evolve_bibkey).
 
     :param index: Index mapping (journal, volume, number) to bibkeys
     :param parsed_result: A parsed article result (may be success or error)
@@ -42,10 +67,7 @@ def match_bibkey_to_article(
         bibkey = get_bibkey_by_journal_volume_number(index, bibitem)
 
         # Match found - return new article with bibkey
-        updated = attrs.evolve(
-            bibitem,
-            bibkey=bibkey,
-        )
+        updated = _evolve_bibkey(bibitem, bibkey)
         return {
             "parsing_status": "success",
             "out": updated,
@@ -16,6 +16,7 @@ from philoch_bib_enhancer.fuzzy_matching.matcher import (
     build_index_cached,
     stage_bibitems_batch,
     stage_bibitems_streaming,
+    stage_bibitems_weight_sweep,
     _RUST_SCORER_AVAILABLE,
 )
 from philoch_bib_enhancer.fuzzy_matching.models import (
@@ -45,5 +46,6 @@ __all__ = [
     "compare_bibitems_detailed",
     "stage_bibitems_batch",
     "stage_bibitems_streaming",
+    "stage_bibitems_weight_sweep",
     "weights_to_tuple",
 ]
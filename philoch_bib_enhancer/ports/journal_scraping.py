@@ -97,6 +97,24 @@ class JournalScraperIN(BaseModel):
         if hasattr(self, "issn"):
             self.issn = self.validate_issn_not_empty(self.issn)
 
+    @classmethod
+    def model_construct_validated(
+        cls,
+        issn: str,
+        year_range: TYearRange,
+        with_bibkey_matching: JournalScraperBibkeyMatchingTabular | None = None,
+    ) -> "JournalScraperIN":
+        """
+        Build from already-typed values (e.g. parsed by argparse), skipping pydantic validation.
+
+        Only the ISSN whitespace/emptiness check is kept; field types are trusted.
+        """
+        return cls.model_construct(
+            issn=cls.validate_issn_not_empty(issn),
+            year_range=year_range,
+            with_bibkey_matching=with_bibkey_matching,
+        )
+
 
 class JournalScraperMainIN(BaseModel):
     """
@@ -111,6 +129,7 @@ class JournalScraperMainIN(BaseModel):
     match_bibkey: TBibkeyMatcher | None = None
     write_articles: TArticleWriter
     output_dir: str = "."
+    gzip_output: bool = False
 
     class Config:
         arbitrary_types_allowed = True
@@ -154,7 +173,8 @@ def main(main_in: JournalScraperMainIN) -> None:
         lgr.info("Bibkey matching completed.")
 
     # Step 3: Write results (delegated to injected function)
-    output_filename = f"{journal_scraper_in.issn}_articles.csv"
+    output_extension = "csv.gz" if main_in.gzip_output else "csv"
+    output_filename = f"{journal_scraper_in.issn}_articles.{output_extension}"
     output_path = os.path.join(main_in.output_dir, output_filename)
     lgr.info(f"Writing articles to {output_path}...")
     write_articles(articles, output_path)
@@ -10,9 +10,8 @@ Usage:
     python scripts/generate_philstudies_benchmark.py
 """
 
-import csv
 import json
-import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import polars as pl
@@ -29,75 +28,69 @@ OUTPUT_BIBLIOGRAPHY = OUTPUT_DIR / "philstudies_bibliography.csv"
 OUTPUT_GROUND_TRUTH = OUTPUT_DIR / "philstudies_ground_truth.json"
 
 
-def load_annotated_csv() -> tuple[list[dict[str, str]], set[str]]:
+def load_annotated_csv() -> tuple[list[dict[str, str]], frozenset[str]]:
     """Load the annotated CSV and extract ground truth + referenced bibkeys.
 
+    The whole annotation pass runs as a single lazy Polars scan: annotation
+    types and expected bibkeys are derived with vectorized expressions, and
+    rows without a known annotation (empty, NOT NEEDED, unknown) are dropped.
+
     Returns:
         Tuple of (ground_truth_cases, all_referenced_bibkeys)
     """
-    ground_truth: list[dict[str, str]] = []
-    referenced_bibkeys: set[str] = set()
-
-    with open(ANNOTATED_CSV, "r", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-
-        for row in reader:
-            comment = (row.get("comment on update") or "").strip()
-
-            if not comment:
-                continue
-
-            # Skip NOT NEEDED entries
-            if comment == "NOT NEEDED":
-                continue
-
-            # Parse annotation type and expected bibkey
-            if comment == "RIGHT KEY":
-                annotation_type = "RIGHT_KEY"
-                expected_bibkey = (row.get("match_1_bibkey") or "").strip()
-                if expected_bibkey:
-                    referenced_bibkeys.add(expected_bibkey)
-            elif comment == "NOT IN BIBLIO":
-                annotation_type = "NOT_IN_BIBLIO"
-                expected_bibkey = ""
-            elif comment.startswith("WRONG KEY"):
-                annotation_type = "WRONG_KEY"
-                # Extract correct bibkey from comment: "WRONG KEY, RIGHT ONE IS: xyz"
-                match = re.search(r"RIGHT ONE IS:\s*(\S+)", comment)
-                expected_bibkey = match.group(1) if match else ""
-                if expected_bibkey:
-                    referenced_bibkeys.add(expected_bibkey)
-                # Also track what the matcher incorrectly chose
-                wrong_match = (row.get("match_1_bibkey") or "").strip()
-                if wrong_match:
-                    referenced_bibkeys.add(wrong_match)
-            else:
-                # Unknown annotation, skip
-                continue
-
-            # Extract subject fields
-            case = {
-                "annotation_type": annotation_type,
-                "expected_bibkey": expected_bibkey,
-                "entry_type": row.get("entry_type") or "",
-                "title": row.get("title") or "",
-                "author": row.get("author") or "",
-                "date": row.get("date") or "",
-                "doi": row.get("doi") or "",
-                "journal": row.get("journal") or "",
-                "volume": row.get("volume") or "",
-                "number": row.get("number") or "",
-                "pages": row.get("pages") or "",
-                # Also capture the original match results for analysis
-                "original_match_1_bibkey": row.get("match_1_bibkey") or "",
-                "original_match_1_score": row.get("match_1_score") or "",
-            }
-            ground_truth.append(case)
-
-    return ground_truth, referenced_bibkeys
-
-
-def filter_bibliography(referenced_bibkeys: set[str]) -> pl.DataFrame:
+    comment = pl.col("comment on update").str.strip_chars()
+    annotation_type = pl.col("annotation_type")
+
+    annotations = (
+        pl.scan_csv(ANNOTATED_CSV, infer_schema=False)
+        .with_columns(pl.all().fill_null(""))
+        .with_columns(
+            pl.when(comment == "RIGHT KEY")
+            .then(pl.lit("RIGHT_KEY"))
+            .when(comment == "NOT IN BIBLIO")
+            .then(pl.lit("NOT_IN_BIBLIO"))
+            .when(comment.str.starts_with("WRONG KEY"))
+            .then(pl.lit("WRONG_KEY"))
+            .otherwise(None)
+            .alias("annotation_type")
+        )
+        # Skips empty comments, NOT NEEDED entries and unknown annotations
+        .filter(annotation_type.is_not_null())
+        .select(
+            annotation_type,
+            # Extract correct bibkey from comment: "WRONG KEY, RIGHT ONE IS: xyz"
+            pl.when(annotation_type == "RIGHT_KEY")
+            .then(pl.col("match_1_bibkey").str.strip_chars())
+            .when(annotation_type == "WRONG_KEY")
+            .then(comment.str.extract(r"RIGHT ONE IS:\s*(\S+)", 1).fill_null(""))
+            .otherwise(pl.lit(""))
+            .alias("expected_bibkey"),
+            # Subject fields
+            "entry_type",
+            "title",
+            "author",
+            "date",
+            "doi",
+            "journal",
+            "volume",
+            "number",
+            "pages",
+            # Also capture the original match results for analysis
+            pl.col("match_1_bibkey").alias("original_match_1_bibkey"),
+            pl.col("match_1_score").alias("original_match_1_score"),
+        )
+        .collect()
+    )
+
+    # Referenced bibkeys: every expected bibkey, plus what the matcher incorrectly chose for WRONG_KEY
+    wrong_matches = annotations.filter(annotation_type == "WRONG_KEY").get_column("original_match_1_bibkey")
+    referenced = pl.concat([annotations.get_column("expected_bibkey"), wrong_matches.str.strip_chars()]).unique()
+    referenced_bibkeys = frozenset(referenced.filter(referenced != "").to_list())
+
+    return annotations.to_dicts(), referenced_bibkeys
+
+
+def filter_bibliography(referenced_bibkeys: frozenset[str]) -> pl.DataFrame:
     """Load bibliography ODS and filter for PhilStudies + referenced entries.
 
     Args:
@@ -126,7 +119,7 @@ def filter_bibliography(referenced_bibkeys: set[str]) -> pl.DataFrame:
     # Filter 2: Bibkey in referenced set
     bibkey_col = "bibkey"
     if bibkey_col in df.columns:
-        referenced_mask = df[bibkey_col].is_in(list(referenced_bibkeys))
+        referenced_mask = df[bibkey_col].is_in(referenced_bibkeys)
         referenced_df = df.filter(referenced_mask)
         print(f"  Referenced bibkey entries: {len(referenced_df)}")
     else:
@@ -140,6 +133,16 @@ def filter_bibliography(referenced_bibkeys: set[str]) -> pl.DataFrame:
     return combined
 
 
+def write_ground_truth(ground_truth: list[dict[str, str]]) -> None:
+    """Write ground truth cases as indented JSON.
+
+    Args:
+        ground_truth: Ground truth cases to serialize
+    """
+    with open(OUTPUT_GROUND_TRUTH, "w", encoding="utf-8") as f:
+        json.dump(ground_truth, f, indent=2, ensure_ascii=False)
+
+
 def main() -> None:
     """Main entry point."""
     print("=" * 70)
@@ -171,14 +174,16 @@ def main() -> None:
     # Step 3: Write outputs
     print("\nStep 3: Writing outputs...")
 
-    # Write bibliography CSV
-    filtered_bib.write_csv(str(OUTPUT_BIBLIOGRAPHY))
+    # The two outputs are independent: write the bibliography CSV (Polars releases the GIL)
+    # while the ground truth JSON is serialized
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        bibliography_written = executor.submit(filtered_bib.write_csv, str(OUTPUT_BIBLIOGRAPHY))
+        ground_truth_written = executor.submit(write_ground_truth, ground_truth)
+        bibliography_written.result()
+        ground_truth_written.result()
+
     print(f"  Bibliography CSV: {OUTPUT_BIBLIOGRAPHY}")
     print(f"    {len(filtered_bib)} entries")
-
-    # Write ground truth JSON
-    with open(OUTPUT_GROUND_TRUTH, "w", encoding="utf-8") as f:
-        json.dump(ground_truth, f, indent=2, ensure_ascii=False)
     print(f"  Ground truth JSON: {OUTPUT_GROUND_TRUTH}")
     print(f"    {len(ground_truth)} cases")
 
@@ -1,25 +1,26 @@
+use ahash::AHashMap;
+use aho_corasick::AhoCorasick;
+use pyo3::exceptions::PyValueError;
 use pyo3::prelude::*;
 use pyo3::types::{PyDict, PyList};
 use rayon::prelude::*;
-use std::cmp::Ordering;
+use std::cmp::{Ordering, Reverse};
 use std::collections::{BinaryHeap, HashMap, HashSet};
-use strsim::jaro_winkler;
 
-/// Input data for a single bibliographic item
+/// Input data for all bibliographic items, one column per field.
+/// Row `i` of every column describes the item at position `i`.
 #[derive(Debug, FromPyObject)]
-struct ItemData {
+struct ItemColumns {
     #[pyo3(item)]
-    item_index: usize,
+    doi: Vec<Option<String>>,
     #[pyo3(item)]
-    doi: Option<String>,
-    #[pyo3(item)]
-    title: String,
+    title: Vec<String>,
     #[pyo3(item)]
-    author_surnames: Vec<String>,
+    author_surnames: Vec<Vec<String>>,
     #[pyo3(item)]
-    year: Option<i32>,
+    year: Vec<Option<i32>>,
     #[pyo3(item)]
-    journal_name: Option<String>,
+    journal_name: Vec<Option<String>>,
 }
 
 /// Output index data structure
@@ -62,34 +63,57 @@ fn get_decade(year: Option<i32>) -> Option<i32> {
 
 /// Build index for fuzzy matching
 #[pyfunction]
-fn build_index_rust(py: Python, items_data: Vec<ItemData>) -> PyResult<IndexData> {
-    use ahash::AHashMap;
+fn build_index_rust(py: Python, items: ItemColumns) -> PyResult<IndexData> {
+    let ItemColumns {
+        doi,
+        title,
+        author_surnames,
+        year,
+        journal_name,
+    } = items;
+    let capacity = title.len();
+    if [
+        doi.len(),
+        author_surnames.len(),
+        year.len(),
+        journal_name.len(),
+    ]
+    .iter()
+    .any(|&len| len != capacity)
+    {
+        return Err(PyValueError::new_err(
+            "all item columns must have the same length",
+        ));
+    }
 
     // Pre-allocate with capacity hints
-    let capacity = items_data.len();
     let mut doi_map: AHashMap<String, usize> = AHashMap::with_capacity(capacity);
     let mut trigram_map: AHashMap<String, Vec<usize>> = AHashMap::new();
     let mut surname_map: AHashMap<String, Vec<usize>> = AHashMap::new();
     let mut decade_map: AHashMap<Option<i32>, Vec<usize>> = AHashMap::new();
     let mut journal_map: AHashMap<String, Vec<usize>> = AHashMap::new();
 
-    // Single pass over all items
-    for item in items_data {
-        let idx = item.item_index;
-
+    // Single pass over all rows
+    let rows = doi
+        .into_iter()
+        .zip(title)
+        .zip(author_surnames)
+        .zip(year)
+        .zip(journal_name);
+    for (idx, ((((doi, title), author_surnames), year), journal_name)) in rows.enumerate() {
         // DOI index
-        if let Some(doi) = item.doi {
+        if let Some(doi) = doi {
             doi_map.insert(doi, idx);
         }
 
         // Title trigram index
-        let trigrams = extract_trigrams(&item.title);
+        let trigrams = extract_trigrams(&title);
         for trigram in trigrams {
             trigram_map.entry(trigram).or_default().push(idx);
         }
 
         // Author surname index
-        for surname in item.author_surnames {
+        for surname in author_surnames {
             let normalized = surname.to_lowercase().trim().to_string();
             if !normalized.is_empty() {
                 surname_map.entry(normalized).or_default().push(idx);
@@ -97,11 +121,11 @@ fn build_index_rust(py: Python, items_data: Vec<ItemData>) -> PyResult<IndexData
         }
 
         // Year decade index
-        let decade = get_decade(item.year);
+        let decade = get_decade(year);
         decade_map.entry(decade).or_default().push(idx);
 
         // Journal index
-        if let Some(journal) = item.journal_name {
+        if let Some(journal) = journal_name {
             let normalized = journal.to_lowercase().trim().to_string();
             if !normalized.is_empty() {
                 journal_map.entry(normalized).or_default().push(idx);
@@ -166,13 +190,22 @@ const ACADEMIC_REVIEW_PREFIXES: &[&str] = &[
     "responses to",
 ];
 
+/// Length in chars of the longest entry in `ACADEMIC_REVIEW_PREFIXES`
+const MAX_ACADEMIC_PREFIX_CHARS: usize = 15;
+
 /// Check if a title starts with an academic review/response prefix
 fn has_academic_prefix(title: &str) -> bool {
-    let normalized = title.to_lowercase();
-    let trimmed = normalized.trim();
+    // Only the start of the title can match, so lowercase just enough of it to cover the
+    // longest prefix instead of the whole title
+    let head: String = title
+        .trim_start()
+        .chars()
+        .take(MAX_ACADEMIC_PREFIX_CHARS)
+        .flat_map(char::to_lowercase)
+        .collect();
     ACADEMIC_REVIEW_PREFIXES
         .iter()
-        .any(|prefix| trimmed.starts_with(prefix))
+        .any(|prefix| head.starts_with(prefix))
 }
 
 /// Normalize text: lowercase and collapse whitespace
@@ -190,11 +223,166 @@ fn tokenize_and_sort(s: &str) -> Vec<&str> {
     tokens
 }
 
+/// Per-character occurrence bitmasks of a string, `words` u64 blocks per character.
+/// Bit `j` of a character's mask is set when the string has that character at position `j`.
+/// ASCII characters resolve their slot through a fixed table; others go through a map.
+struct CharMasks {
+    words: usize,
+    ascii_slots: [u32; 128],
+    other_slots: AHashMap<char, u32>,
+    masks: Vec<u64>,
+}
+
+impl CharMasks {
+    fn new(chars: &[char]) -> Self {
+        let words = chars.len().div_ceil(64);
+        let mut ascii_slots = [u32::MAX; 128];
+        let mut other_slots: AHashMap<char, u32> = AHashMap::new();
+        let mut masks: Vec<u64> = Vec::with_capacity(words * 32);
+        let mut next_slot: u32 = 0;
+        for (j, &c) in chars.iter().enumerate() {
+            let slot = if c.is_ascii() {
+                &mut ascii_slots[c as usize]
+            } else {
+                other_slots.entry(c).or_insert(u32::MAX)
+            };
+            if *slot == u32::MAX {
+                *slot = next_slot;
+                next_slot += 1;
+                masks.resize(masks.len() + words, 0);
+            }
+            masks[*slot as usize * words + j / 64] |= 1u64 << (j % 64);
+        }
+        Self {
+            words,
+            ascii_slots,
+            other_slots,
+            masks,
+        }
+    }
+
+    fn get(&self, c: char) -> Option<&[u64]> {
+        let slot = if c.is_ascii() {
+            self.ascii_slots[c as usize]
+        } else {
+            *self.other_slots.get(&c)?
+        };
+        if slot == u32::MAX {
+            return None;
+        }
+        let start = slot as usize * self.words;
+        Some(&self.masks[start..start + self.words])
+    }
+}
+
+/// Flag the lowest position in `[lo, hi)` that is set in `mask` and not yet in `flags`.
+/// Returns whether such a position existed.
+fn take_first_unflagged(mask: &[u64], flags: &mut [u64], lo: usize, hi: usize) -> bool {
+    if lo >= hi {
+        return false;
+    }
+    let first = lo / 64;
+    let last = (hi - 1) / 64;
+    for w in first..=last {
+        let mut bits = mask[w] & !flags[w];
+        if w == first {
+            bits &= u64::MAX << (lo % 64);
+        }
+        if w == last {
+            let end = hi - w * 64;
+            if end < 64 {
+                bits &= (1u64 << end) - 1;
+            }
+        }
+        if bits != 0 {
+            flags[w] |= bits & bits.wrapping_neg();
+            return true;
+        }
+    }
+    false
+}
+
+/// Bit-parallel Jaro-Winkler similarity (0.0-1.0).
+///
+/// Same greedy matching and result as `strsim::jaro_winkler`, but the search for a matching,
+/// not-yet-used character inside the Jaro window is a masked word scan instead of a
+/// per-character loop, so each character of `a` costs O(window / 64) instead of O(window).
+fn jaro_winkler(a: &str, b: &str) -> f64 {
+    let a_chars: Vec<char> = a.chars().collect();
+    let b_chars: Vec<char> = b.chars().collect();
+    let a_len = a_chars.len();
+    let b_len = b_chars.len();
+
+    if a_len == 0 && b_len == 0 {
+        return 1.0;
+    } else if a_len == 0 || b_len == 0 {
+        return 0.0;
+    }
+
+    let search_range = (a_len.max(b_len) / 2).saturating_sub(1);
+    let b_masks = CharMasks::new(&b_chars);
+    let mut b_flags = vec![0u64; b_masks.words];
+    let mut a_matched: Vec<char> = Vec::with_capacity(a_len.min(b_len));
+
+    for (i, &c) in a_chars.iter().enumerate() {
+        let Some(mask) = b_masks.get(c) else {
+            continue;
+        };
+        let lo = i.saturating_sub(search_range);
+        let hi = b_len.min(i + search_range + 1);
+        if take_first_unflagged(mask, &mut b_flags, lo, hi) {
+            a_matched.push(c);
+        }
+    }
+
+    let matches = a_matched.len();
+    if matches == 0 {
+        return 0.0;
+    }
+
+    // Matched characters of `a` and `b`, taken in order, are compared pairwise
+    let mut transpositions = 0_usize;
+    let mut k = 0;
+    for (w, &word) in b_flags.iter().enumerate() {
+        let mut bits = word;
+        while bits != 0 {
+            let j = w * 64 + bits.trailing_zeros() as usize;
+            if b_chars[j] != a_matched[k] {
+                transpositions += 1;
+            }
+            k += 1;
+            bits &= bits - 1;
+        }
+    }
+    transpositions /= 2;
+
+    let sim = ((matches as f64 / a_len as f64)
+        + (matches as f64 / b_len as f64)
+        + ((matches - transpositions) as f64 / matches as f64))
+        / 3.0;
+
+    if sim > 0.7 {
+        let prefix_length = a_chars
+            .iter()
+            .take(4)
+            .zip(&b_chars)
+            .take_while(|(x, y)| x == y)
+            .count();
+        sim + 0.1 * prefix_length as f64 * (1.0 - sim)
+    } else {
+        sim
+    }
+}
+
 /// Internal token sort ratio returning f64 (0.0-100.0)
 fn token_sort_ratio_f64(s1: &str, s2: &str) -> f64 {
     if s1.is_empty() || s2.is_empty() {
         return 0.0;
     }
+    // Identical inputs normalize identically: skip tokenizing unless only whitespace remains
+    if s1 == s2 {
+        return if s1.trim().is_empty() { 0.0 } else { 100.0 };
+    }
 
     let norm1 = normalize(s1);
     let norm2 = normalize(s2);
@@ -208,11 +396,25 @@ fn token_sort_ratio_f64_prenormalized(norm1: &str, norm2: &str) -> f64 {
         return 0.0;
     }
 
-    let sorted1 = tokenize_and_sort(norm1).join(" ");
-    let sorted2 = tokenize_and_sort(norm2).join(" ");
+    token_sort_ratio_presorted(&sort_tokens(norm1), &sort_tokens(norm2))
+}
+
+/// Tokens of a normalized string, sorted and joined with single spaces
+fn sort_tokens(norm: &str) -> String {
+    tokenize_and_sort(norm).join(" ")
+}
+
+/// Token sort ratio on strings already passed through `sort_tokens`
+fn token_sort_ratio_presorted(sorted1: &str, sorted2: &str) -> f64 {
+    if sorted1.is_empty() || sorted2.is_empty() {
+        return 0.0;
+    }
+    if sorted1 == sorted2 {
+        return 100.0;
+    }
 
     // Jaro-Winkler returns 0.0-1.0, scale to 0-100
-    jaro_winkler(&sorted1, &sorted2) * 100.0
+    jaro_winkler(sorted1, sorted2) * 100.0
 }
 
 /// Token sort ratio for Python: returns float 0.0-100.0
@@ -248,9 +450,11 @@ struct MatchResult {
     bonus_score: f64,
 }
 
+/// Results are ordered by rank: a higher total score is greater, and on equal scores the lower
+/// candidate index is greater, so the ranking never depends on the order results were produced in.
 impl PartialEq for MatchResult {
     fn eq(&self, other: &Self) -> bool {
-        self.total_score == other.total_score
+        self.cmp(other) == Ordering::Equal
     }
 }
 
@@ -267,6 +471,7 @@ impl Ord for MatchResult {
         self.total_score
             .partial_cmp(&other.total_score)
             .unwrap_or(Ordering::Equal)
+            .then_with(|| other.candidate_index.cmp(&self.candidate_index))
     }
 }
 
@@ -277,11 +482,23 @@ fn score_title_prenorm(norm_subject: &str, title2: &str, weight: f64) -> f64 {
     }
 
     let norm2 = normalize(title2);
+    score_title_normalized(norm_subject, &norm2, weight)
+}
 
-    let raw_score = token_sort_ratio_f64_prenormalized(norm_subject, &norm2);
+/// Score title similarity with bonuses (both titles pre-normalized)
+fn score_title_normalized(norm_subject: &str, norm2: &str, weight: f64) -> f64 {
+    if norm_subject.is_empty() {
+        return 0.0;
+    }
+
+    let raw_score = token_sort_ratio_f64_prenormalized(norm_subject, norm2);
+    apply_title_bonuses(norm_subject, norm2, raw_score, weight)
+}
 
+/// Apply the containment bonus and keyword penalties to a raw title token sort ratio
+fn apply_title_bonuses(norm_subject: &str, norm2: &str, raw_score: f64, weight: f64) -> f64 {
     // Check if one title contains the other (subtitle handling)
-    let one_contains_other = norm_subject.contains(&norm2) || norm2.contains(norm_subject);
+    let one_contains_other = norm_subject.contains(norm2) || norm2.contains(norm_subject);
 
     // Check for undesired keywords mismatch (no allocation version)
     let has_errata1 = norm_subject.contains("errata");
@@ -307,6 +524,79 @@ fn score_title_prenorm(norm_subject: &str, title2: &str, weight: f64) -> f64 {
     final_score.max(0.0) * weight
 }
 
+/// Number of buckets in a `CharSketch`
+const CHAR_SKETCH_BUCKETS: usize = 64;
+
+/// Per-bucket character counts of a string, a compact stand-in for its character multiset.
+///
+/// Lowercase ASCII letters and digits get a bucket each; all other characters share the rest.
+/// Merging characters into buckets only ever raises `common_chars`, so it stays an upper bound
+/// on the characters two strings have in common.
+struct CharSketch {
+    counts: [u8; CHAR_SKETCH_BUCKETS],
+    /// Some bucket overflowed `u8`, so the counts no longer bound anything
+    saturated: bool,
+}
+
+impl CharSketch {
+    fn new(s: &str) -> Self {
+        let mut counts = [0u8; CHAR_SKETCH_BUCKETS];
+        let mut saturated = false;
+        for c in s.chars() {
+            let bucket = match c {
+                'a'..='z' => c as usize - 'a' as usize,
+                '0'..='9' => 26 + (c as usize - '0' as usize),
+                _ => 36 + c as usize % (CHAR_SKETCH_BUCKETS - 36),
+            };
+            match counts[bucket].checked_add(1) {
+                Some(count) => counts[bucket] = count,
+                None => saturated = true,
+            }
+        }
+        Self { counts, saturated }
+    }
+
+    /// Upper bound on the size of the common character multiset of the two strings, `None` if
+    /// either sketch is saturated
+    fn common_chars(&self, other: &Self) -> Option<usize> {
+        if self.saturated || other.saturated {
+            return None;
+        }
+        Some(
+            self.counts
+                .iter()
+                .zip(&other.counts)
+                .map(|(&a, &b)| usize::from(a.min(b)))
+                .sum(),
+        )
+    }
+}
+
+/// Upper bound on `score_title_normalized` from the character counts of the two normalized
+/// titles and an upper bound `common` on the characters they share.
+///
+/// Token sorting keeps the characters, so Jaro can match at most `common` of them; the Winkler
+/// prefix boost is assumed to apply. The +100 similarity bonus is only assumed when the fuzzy
+/// bound exceeds its threshold or one title could contain the other, which needs every
+/// character of the shorter one to be shared.
+fn title_score_upper_bound(len1: usize, len2: usize, common: usize, weight: f64) -> f64 {
+    let m = common.min(len1).min(len2);
+    let raw_bound = if m == 0 {
+        0.0
+    } else {
+        let m = m as f64;
+        let jaro = (m / len1 as f64 + m / len2 as f64 + 1.0) / 3.0;
+        (jaro + 0.4 * (1.0 - jaro)) * 100.0
+    };
+    let containment_possible = m == len1.min(len2);
+    let bonus = if raw_bound + SCORE_BOUND_SLACK > 85.0 || containment_possible {
+        100.0
+    } else {
+        0.0
+    };
+    (raw_bound + bonus) * weight.max(0.0)
+}
+
 /// Score title similarity with bonuses (normalizes both titles)
 fn score_title(title1: &str, title2: &str, weight: f64) -> f64 {
     if title1.is_empty() || title2.is_empty() {
@@ -405,7 +695,31 @@ fn score_author(author1: &str, author2: &str, weight: f64) -> f64 {
         return 0.0;
     }
 
-    let raw_score = token_sort_ratio_f64(author1, author2);
+    author_score_with_bonuses(
+        author1,
+        author2,
+        token_sort_ratio_f64(author1, author2),
+        weight,
+    )
+}
+
+/// Score author similarity between precomputed items (token-sorted authors staged once)
+fn score_author_precomputed(
+    subject: &PrecomputedItem,
+    candidate: &PrecomputedItem,
+    weight: f64,
+) -> f64 {
+    let (author1, author2) = (&subject.data.author, &candidate.data.author);
+    if author1.is_empty() || author2.is_empty() {
+        return 0.0;
+    }
+
+    let raw_score = token_sort_ratio_presorted(&subject.sorted_author, &candidate.sorted_author);
+    author_score_with_bonuses(author1, author2, raw_score, weight)
+}
+
+/// Apply the high-similarity and initials bonuses to a raw author token sort ratio
+fn author_score_with_bonuses(author1: &str, author2: &str, raw_score: f64, weight: f64) -> f64 {
     let mut final_score = raw_score;
 
     if raw_score > 85.0 {
@@ -492,30 +806,31 @@ fn score_bonus(subject: &BibItemData, candidate: &BibItemData, weight: f64) -> f
     bonus * weight
 }
 
-/// Score bonus fields with precomputed subject data (avoids repeated normalization)
+/// Score bonus fields with precomputed subject and candidate data (avoids repeated normalization)
 fn score_bonus_precomputed(
-    subject: &PrecomputedSubject,
-    candidate: &BibItemData,
+    subject: &PrecomputedItem,
+    candidate: &PrecomputedItem,
     weight: f64,
 ) -> f64 {
     let mut bonus = 0.0;
 
     // DOI exact match (highest confidence)
-    if let (Some(ref doi1), Some(ref doi2)) = (&subject.data.doi, &candidate.doi) {
+    if let (Some(ref doi1), Some(ref doi2)) = (&subject.data.doi, &candidate.data.doi) {
         if !doi1.is_empty() && doi1 == doi2 {
             bonus += 100.0;
         }
     }
 
-    // Journal + Volume + Number match (use precomputed normalized journal)
-    if let (Some(ref norm_j1), Some(ref j2)) = (&subject.normalized_journal, &candidate.journal) {
-        let norm_j2 = normalize(j2);
-        if !norm_j1.is_empty() && norm_j1 == &norm_j2 {
-            let vol_match = match (&subject.data.volume, &candidate.volume) {
+    // Journal + Volume + Number match (use precomputed normalized journals)
+    if let (Some(ref norm_j1), Some(ref norm_j2)) =
+        (&subject.normalized_journal, &candidate.normalized_journal)
+    {
+        if !norm_j1.is_empty() && norm_j1 == norm_j2 {
+            let vol_match = match (&subject.data.volume, &candidate.data.volume) {
                 (Some(v1), Some(v2)) => !v1.is_empty() && v1 == v2,
                 _ => false,
             };
-            let num_match = match (&subject.data.number, &candidate.number) {
+            let num_match = match (&subject.data.number, &candidate.data.number) {
                 (Some(n1), Some(n2)) => !n1.is_empty() && n1 == n2,
                 _ => false,
             };
@@ -526,19 +841,18 @@ fn score_bonus_precomputed(
     }
 
     // Pages match
-    if let (Some(ref p1), Some(ref p2)) = (&subject.data.pages, &candidate.pages) {
+    if let (Some(ref p1), Some(ref p2)) = (&subject.data.pages, &candidate.data.pages) {
         if !p1.is_empty() && p1 == p2 {
             bonus += 20.0;
         }
     }
 
-    // Publisher match (use precomputed normalized publisher)
-    if let (Some(ref norm_pub1), Some(ref pub2)) =
-        (&subject.normalized_publisher, &candidate.publisher)
+    // Publisher match (use precomputed token-sorted publishers)
+    if let (Some(ref sorted_pub1), Some(ref sorted_pub2)) =
+        (&subject.sorted_publisher, &candidate.sorted_publisher)
     {
-        if !norm_pub1.is_empty() && !pub2.is_empty() {
-            let norm_pub2 = normalize(pub2);
-            let pub_score = token_sort_ratio_f64_prenormalized(norm_pub1, &norm_pub2);
+        if !sorted_pub1.is_empty() && !sorted_pub2.is_empty() {
+            let pub_score = token_sort_ratio_presorted(sorted_pub1, sorted_pub2);
             if pub_score > 85.0 {
                 bonus += 10.0;
             }
@@ -562,23 +876,60 @@ struct Weights {
     bonus: f64,
 }
 
-/// Precomputed data for a subject to avoid recomputation per candidate
-struct PrecomputedSubject<'a> {
-    data: &'a BibItemData,
+/// Every component score is its raw score times its weight, so scoring with unit weights yields
+/// the raw component scores
+const UNIT_WEIGHTS: Weights = Weights {
+    title: 1.0,
+    author: 1.0,
+    date: 1.0,
+    bonus: 1.0,
+};
+
+impl MatchResult {
+    /// Apply `weights` to a result scored with `UNIT_WEIGHTS`. The products and their sum are
+    /// the same floats as scoring with `weights` directly.
+    fn reweighted(&self, weights: &Weights) -> MatchResult {
+        let title_score = self.title_score * weights.title;
+        let author_score = self.author_score * weights.author;
+        let date_score = self.date_score * weights.date;
+        let bonus_score = self.bonus_score * weights.bonus;
+        MatchResult {
+            candidate_index: self.candidate_index,
+            total_score: title_score + author_score + date_score + bonus_score,
+            title_score,
+            author_score,
+            date_score,
+            bonus_score,
+        }
+    }
+}
+
+/// Precomputed data for a subject or candidate to avoid recomputation per comparison
+struct PrecomputedItem {
+    data: BibItemData,
     has_academic_prefix: bool,
     normalized_title: String,
+    normalized_title_len: usize,
+    title_sketch: CharSketch,
+    sorted_title: String,
+    sorted_author: String,
     normalized_journal: Option<String>,
-    normalized_publisher: Option<String>,
+    sorted_publisher: Option<String>,
 }
 
-impl<'a> PrecomputedSubject<'a> {
-    fn new(data: &'a BibItemData) -> Self {
+impl PrecomputedItem {
+    fn new(data: BibItemData) -> Self {
+        let normalized_title = normalize(&data.title);
         Self {
-            data,
             has_academic_prefix: has_academic_prefix(&data.title),
-            normalized_title: normalize(&data.title),
+            normalized_title_len: normalized_title.chars().count(),
+            title_sketch: CharSketch::new(&normalized_title),
+            sorted_title: sort_tokens(&normalized_title),
+            normalized_title,
+            sorted_author: sort_tokens(&normalize(&data.author)),
             normalized_journal: data.journal.as_ref().map(|j| normalize(j)),
-            normalized_publisher: data.publisher.as_ref().map(|p| normalize(p)),
+            sorted_publisher: data.publisher.as_ref().map(|p| sort_tokens(&normalize(p))),
+            data,
         }
     }
 }
@@ -620,17 +971,34 @@ fn score_candidate(
     }
 }
 
+/// Score title similarity between precomputed items (no per-comparison normalization)
+fn score_title_precomputed(
+    subject: &PrecomputedItem,
+    candidate: &PrecomputedItem,
+    weight: f64,
+) -> f64 {
+    if candidate.data.title.is_empty() || subject.normalized_title.is_empty() {
+        return 0.0;
+    }
+    let raw_score = token_sort_ratio_presorted(&subject.sorted_title, &candidate.sorted_title);
+    apply_title_bonuses(
+        &subject.normalized_title,
+        &candidate.normalized_title,
+        raw_score,
+        weight,
+    )
+}
+
 /// Score a single candidate against precomputed subject data (optimized)
 fn score_candidate_precomputed(
-    subject: &PrecomputedSubject,
-    candidate: &BibItemData,
+    subject: &PrecomputedItem,
+    candidate: &PrecomputedItem,
     weights: &Weights,
 ) -> MatchResult {
-    // Academic prefix gate using precomputed subject prefix
-    let candidate_has_prefix = has_academic_prefix(&candidate.title);
-    if subject.has_academic_prefix != candidate_has_prefix {
+    // Academic prefix gate using precomputed prefix flags
+    if subject.has_academic_prefix != candidate.has_academic_prefix {
         return MatchResult {
-            candidate_index: candidate.index,
+            candidate_index: candidate.data.index,
             total_score: 0.0,
             title_score: 0.0,
             author_score: 0.0,
@@ -639,17 +1007,16 @@ fn score_candidate_precomputed(
         };
     }
 
-    // Use precomputed normalized title
-    let title_score =
-        score_title_prenorm(&subject.normalized_title, &candidate.title, weights.title);
-    let author_score = score_author(&subject.data.author, &candidate.author, weights.author);
-    let date_score = score_date(subject.data.year, candidate.year, weights.date);
+    // Use precomputed normalized titles
+    let title_score = score_title_precomputed(subject, candidate, weights.title);
+    let author_score = score_author_precomputed(subject, candidate, weights.author);
+    let date_score = score_date(subject.data.year, candidate.data.year, weights.date);
     let bonus_score = score_bonus_precomputed(subject, candidate, weights.bonus);
 
     let total_score = title_score + author_score + date_score + bonus_score;
 
     MatchResult {
-        candidate_index: candidate.index,
+        candidate_index: candidate.data.index,
         total_score,
         title_score,
         author_score,
@@ -658,6 +1025,58 @@ fn score_candidate_precomputed(
     }
 }
 
+/// Slack added to score upper bounds so float rounding never prunes a reachable candidate
+const SCORE_BOUND_SLACK: f64 = 1e-9;
+
+/// Score a candidate against precomputed subject data, or return `None` if its total score
+/// is below `threshold`.
+///
+/// Author, date and bonus are scored first. The title kernel only runs when their sum plus
+/// `title_score_upper_bound` can still reach `threshold`, so candidates that cannot make the
+/// cut skip the most expensive comparison. Scores of returned results are unchanged.
+fn score_candidate_above(
+    subject: &PrecomputedItem,
+    candidate: &PrecomputedItem,
+    weights: &Weights,
+    threshold: f64,
+) -> Option<MatchResult> {
+    if subject.has_academic_prefix != candidate.has_academic_prefix {
+        return (0.0 >= threshold).then_some(MatchResult {
+            candidate_index: candidate.data.index,
+            total_score: 0.0,
+            title_score: 0.0,
+            author_score: 0.0,
+            date_score: 0.0,
+            bonus_score: 0.0,
+        });
+    }
+
+    let author_score = score_author_precomputed(subject, candidate, weights.author);
+    let date_score = score_date(subject.data.year, candidate.data.year, weights.date);
+    let bonus_score = score_bonus_precomputed(subject, candidate, weights.bonus);
+
+    let (len1, len2) = (subject.normalized_title_len, candidate.normalized_title_len);
+    let common = subject
+        .title_sketch
+        .common_chars(&candidate.title_sketch)
+        .unwrap_or(usize::MAX);
+    let title_bound = title_score_upper_bound(len1, len2, common, weights.title);
+    if title_bound + author_score + date_score + bonus_score + SCORE_BOUND_SLACK < threshold {
+        return None;
+    }
+    let title_score = score_title_precomputed(subject, candidate, weights.title);
+
+    let total_score = title_score + author_score + date_score + bonus_score;
+    (total_score >= threshold).then_some(MatchResult {
+        candidate_index: candidate.data.index,
+        total_score,
+        title_score,
+        author_score,
+        date_score,
+        bonus_score,
+    })
+}
+
 /// Find top N matches for a single subject
 fn find_top_matches(
     subject: &BibItemData,
@@ -680,26 +1099,78 @@ fn find_top_matches(
     }
 
     // Score all candidates and keep top N
-    let mut heap: BinaryHeap<MatchResult> = BinaryHeap::new();
+    let scored: Vec<MatchResult> = candidates
+        .iter()
+        .map(|candidate| score_candidate(subject, candidate, weights))
+        .filter(|result| result.total_score >= min_score)
+        .collect();
+
+    take_top_n(scored, top_n)
+}
+
+/// Keep the `top_n` best results, best first.
+///
+/// Quickselect partitions the `top_n` best results to the front in linear time, so only those
+/// few get sorted instead of every scored candidate.
+fn take_top_n(mut results: Vec<MatchResult>, top_n: usize) -> Vec<MatchResult> {
+    if top_n == 0 {
+        return Vec::new();
+    }
+    if results.len() > top_n {
+        results.select_nth_unstable_by(top_n - 1, |a, b| b.cmp(a));
+        results.truncate(top_n);
+    }
+    results.sort_unstable_by(|a, b| b.cmp(a));
+    results
+}
 
-    for candidate in candidates {
-        let result = score_candidate(subject, candidate, weights);
-        if result.total_score >= min_score {
-            heap.push(result);
+/// Bounded collector for the `top_n` best results, best first.
+///
+/// Keeps a min-heap of at most `top_n` results. Once it is full, the worst kept score is the
+/// threshold a new candidate must reach, so `score_candidate_above` can skip the title kernel for
+/// candidates that could not displace anything. Yields the same results as `take_top_n` over
+/// every scored candidate.
+struct TopN {
+    top_n: usize,
+    heap: BinaryHeap<Reverse<MatchResult>>,
+}
+
+impl TopN {
+    fn new(top_n: usize) -> Self {
+        Self {
+            top_n,
+            heap: BinaryHeap::with_capacity(top_n),
         }
     }
 
-    // Extract top N
-    let mut results: Vec<MatchResult> = Vec::with_capacity(top_n.min(heap.len()));
-    for _ in 0..top_n {
-        if let Some(result) = heap.pop() {
-            results.push(result);
-        } else {
-            break;
+    /// Lowest total score a new result needs to be kept
+    fn threshold(&self, min_score: f64) -> f64 {
+        match self.heap.peek() {
+            Some(Reverse(worst)) if self.heap.len() == self.top_n => {
+                worst.total_score.max(min_score)
+            }
+            _ => min_score,
         }
     }
 
-    results
+    fn push(&mut self, result: MatchResult) {
+        if self.heap.len() < self.top_n {
+            self.heap.push(Reverse(result));
+        } else if let Some(mut worst) = self.heap.peek_mut() {
+            if result > worst.0 {
+                *worst = Reverse(result);
+            }
+        }
+    }
+
+    fn into_sorted(self) -> Vec<MatchResult> {
+        // Ascending `Reverse` order is descending rank
+        self.heap
+            .into_sorted_vec()
+            .into_iter()
+            .map(|Reverse(result)| result)
+            .collect()
+    }
 }
 
 /// Result for a single subject with its top matches
@@ -723,10 +1194,56 @@ struct BlockingIndexData {
     decade_index: HashMap<i32, Vec<usize>>,
 }
 
+/// Finds the indexed surnames contained in an author string.
+///
+/// Built once per corpus: an Aho-Corasick automaton over all indexed surnames finds every one
+/// occurring in the author string in a single pass over it, instead of one substring search per
+/// indexed surname for every subject.
+struct SurnameMatcher {
+    /// Automaton over the surnames, `None` if there were too many to compile one
+    automaton: Option<AhoCorasick>,
+    /// Surnames and their postings, in automaton pattern order
+    surnames: Vec<(String, Vec<usize>)>,
+}
+
+impl SurnameMatcher {
+    fn new(surname_index: &HashMap<String, Vec<usize>>) -> Self {
+        let surnames: Vec<(String, Vec<usize>)> = surname_index
+            .iter()
+            .map(|(surname, idxs)| (surname.clone(), idxs.clone()))
+            .collect();
+        let automaton = AhoCorasick::new(surnames.iter().map(|(surname, _)| surname)).ok();
+        Self {
+            automaton,
+            surnames,
+        }
+    }
+
+    /// Call `f` with the postings of every indexed surname that appears in `author_lower`
+    fn for_each_match(&self, author_lower: &str, mut f: impl FnMut(&[usize])) {
+        match &self.automaton {
+            // Overlapping search reports every surname occurring in the text, like `contains`
+            Some(automaton) => {
+                for found in automaton.find_overlapping_iter(author_lower) {
+                    f(&self.surnames[found.pattern().as_usize()].1);
+                }
+            }
+            None => {
+                for (surname, idxs) in &self.surnames {
+                    if author_lower.contains(surname.as_str()) {
+                        f(idxs);
+                    }
+                }
+            }
+        }
+    }
+}
+
 /// Get candidate indices for a subject using the blocking index
 fn get_candidate_indices(
     subject: &BibItemData,
     index: &BlockingIndexData,
+    surnames: &SurnameMatcher,
     num_candidates: usize,
 ) -> Vec<usize> {
     // DOI exact match - return immediately
@@ -738,23 +1255,29 @@ fn get_candidate_indices(
         }
     }
 
-    let mut indices: HashSet<usize> = HashSet::new();
+    // Union of all postings as a membership mask over candidate positions: marking is a plain
+    // store instead of a hash insert, and the result comes out in ascending position order, so
+    // candidates are then scored front to back through memory
+    let mut is_candidate = vec![false; num_candidates];
+    let mut mark = |idxs: &[usize]| {
+        for &idx in idxs {
+            if let Some(slot) = is_candidate.get_mut(idx) {
+                *slot = true;
+            }
+        }
+    };
 
     // Title trigrams
     let trigrams = extract_trigrams(&subject.title);
     for trigram in trigrams {
         if let Some(idxs) = index.trigram_index.get(&trigram) {
-            indices.extend(idxs);
+            mark(idxs);
         }
     }
 
     // Author surnames - check if any indexed surname appears in the author string
     let author_lower = subject.author.to_lowercase();
-    for (surname, idxs) in &index.surname_index {
-        if author_lower.contains(surname) {
-            indices.extend(idxs);
-        }
-    }
+    surnames.for_each_match(&author_lower, &mut mark);
 
     // Year decades (±5 decades = ±50 years)
     if let Some(year) = subject.year {
@@ -762,22 +1285,30 @@ fn get_candidate_indices(
         for offset in -5..=5 {
             let decade = subject_decade + (offset * 10);
             if let Some(idxs) = index.decade_index.get(&decade) {
-                indices.extend(idxs);
+                mark(idxs);
             }
         }
     }
 
+    let indices: Vec<usize> = is_candidate
+        .iter()
+        .enumerate()
+        .filter_map(|(idx, &marked)| marked.then_some(idx))
+        .collect();
+
     // Fallback to all if no candidates found
     if indices.is_empty() {
         return (0..num_candidates).collect();
     }
 
-    indices.into_iter().collect()
+    indices
 }
 
 /// Batch score multiple subjects against candidates in parallel.
+/// The GIL is released while scoring, so other Python threads keep running.
 #[pyfunction]
 fn score_batch(
+    py: Python<'_>,
     subjects: Vec<BibItemData>,
     candidates: Vec<BibItemData>,
     top_n: usize,
@@ -786,26 +1317,28 @@ fn score_batch(
 ) -> Vec<SubjectMatchResult> {
     let candidates_len = candidates.len();
 
-    subjects
-        .par_iter()
-        .enumerate()
-        .map(|(idx, subject)| {
-            let matches = find_top_matches(subject, &candidates, top_n, min_score, &weights);
-            SubjectMatchResult {
-                subject_index: idx,
-                matches,
-                candidates_searched: candidates_len,
-            }
-        })
-        .collect()
+    py.allow_threads(|| {
+        subjects
+            .par_iter()
+            .enumerate()
+            .map(|(idx, subject)| {
+                let matches = find_top_matches(subject, &candidates, top_n, min_score, &weights);
+                SubjectMatchResult {
+                    subject_index: idx,
+                    matches,
+                    candidates_searched: candidates_len,
+                }
+            })
+            .collect()
+    })
 }
 
 /// Find top matches using precomputed subject and filtered candidate indices
 fn find_top_matches_indexed(
-    subject: &PrecomputedSubject,
-    candidates: &[BibItemData],
+    subject: &PrecomputedItem,
+    candidates: &[PrecomputedItem],
     candidate_indices: &[usize],
-    doi_map: &HashMap<&str, usize>,
+    doi_map: &HashMap<String, usize>,
     top_n: usize,
     min_score: f64,
     weights: &Weights,
@@ -820,36 +1353,219 @@ fn find_top_matches_indexed(
         }
     }
 
-    // Score only the filtered candidates
-    let mut heap: BinaryHeap<MatchResult> = BinaryHeap::new();
+    // Score only the filtered candidates, raising the bar as the top N fills up
+    let mut top = TopN::new(top_n);
+    if top_n > 0 {
+        for &cand_idx in candidate_indices {
+            if cand_idx < candidates.len() {
+                let threshold = top.threshold(min_score);
+                if let Some(result) =
+                    score_candidate_above(subject, &candidates[cand_idx], weights, threshold)
+                {
+                    top.push(result);
+                }
+            }
+        }
+    }
+
+    let searched = candidate_indices.len();
+    (top.into_sorted(), searched)
+}
+
+/// Like `find_top_matches_indexed`, for several weight configurations at once.
+///
+/// Each candidate is scored once with `UNIT_WEIGHTS` and then reweighted per configuration, so
+/// sweeping many configurations costs a single scoring pass. The results for each configuration
+/// are identical to `find_top_matches_indexed` with those weights.
+fn find_top_matches_indexed_sweep(
+    subject: &PrecomputedItem,
+    candidates: &[PrecomputedItem],
+    candidate_indices: &[usize],
+    doi_map: &HashMap<String, usize>,
+    top_n: usize,
+    min_score: f64,
+    weights: &[Weights],
+) -> (Vec<Vec<MatchResult>>, usize) {
+    if let Some(ref subject_doi) = subject.data.doi {
+        if !subject_doi.is_empty() {
+            if let Some(&cand_idx) = doi_map.get(subject_doi.as_str()) {
+                let raw =
+                    score_candidate_precomputed(subject, &candidates[cand_idx], &UNIT_WEIGHTS);
+                return (weights.iter().map(|w| vec![raw.reweighted(w)]).collect(), 1);
+            }
+        }
+    }
+
+    // Scored results per configuration
+    let mut scored: Vec<Vec<MatchResult>> = weights.iter().map(|_| Vec::new()).collect();
 
     for &cand_idx in candidate_indices {
         if cand_idx < candidates.len() {
-            let result = score_candidate_precomputed(subject, &candidates[cand_idx], weights);
-            if result.total_score >= min_score {
-                heap.push(result);
+            let raw = score_candidate_precomputed(subject, &candidates[cand_idx], &UNIT_WEIGHTS);
+            for (results, w) in scored.iter_mut().zip(weights) {
+                let result = raw.reweighted(w);
+                if result.total_score >= min_score {
+                    results.push(result);
+                }
             }
         }
     }
 
-    // Extract top N
     let searched = candidate_indices.len();
-    let mut results: Vec<MatchResult> = Vec::with_capacity(top_n.min(heap.len()));
-    for _ in 0..top_n {
-        if let Some(result) = heap.pop() {
-            results.push(result);
-        } else {
-            break;
+    (
+        scored
+            .into_iter()
+            .map(|results| take_top_n(results, top_n))
+            .collect(),
+        searched,
+    )
+}
+
+/// Candidate bibliography prepared for repeated scoring.
+///
+/// Holds the candidates with their normalized fields and the blocking index as Rust data, so
+/// the conversion from Python and the per-candidate normalization happen once per bibliography
+/// instead of once per `score_batch_indexed` call.
+#[pyclass(frozen)]
+struct CandidateCorpus {
+    candidates: Vec<PrecomputedItem>,
+    index: BlockingIndexData,
+    surnames: SurnameMatcher,
+    doi_map: HashMap<String, usize>,
+}
+
+impl CandidateCorpus {
+    fn build(candidates: Vec<BibItemData>, index: BlockingIndexData) -> Self {
+        let candidates: Vec<PrecomputedItem> = candidates
+            .into_par_iter()
+            .map(PrecomputedItem::new)
+            .collect();
+
+        // Build DOI map once for O(1) lookups
+        let doi_map: HashMap<String, usize> = candidates
+            .iter()
+            .filter_map(|c| {
+                c.data
+                    .doi
+                    .as_ref()
+                    .filter(|d| !d.is_empty())
+                    .map(|d| (d.clone(), c.data.index))
+            })
+            .collect();
+
+        let surnames = SurnameMatcher::new(&index.surname_index);
+
+        Self {
+            candidates,
+            index,
+            surnames,
+            doi_map,
         }
     }
 
-    (results, searched)
+    fn score_subjects(
+        &self,
+        subjects: Vec<BibItemData>,
+        top_n: usize,
+        min_score: f64,
+        weights: &Weights,
+    ) -> Vec<SubjectMatchResult> {
+        let num_candidates = self.candidates.len();
+
+        subjects
+            .into_par_iter()
+            .enumerate()
+            .map(|(idx, subject)| {
+                // Get filtered candidate indices from blocking index
+                let candidate_indices =
+                    get_candidate_indices(&subject, &self.index, &self.surnames, num_candidates);
+
+                // Precompute subject data once
+                let precomputed = PrecomputedItem::new(subject);
+
+                // Score only filtered candidates
+                let (matches, searched) = find_top_matches_indexed(
+                    &precomputed,
+                    &self.candidates,
+                    &candidate_indices,
+                    &self.doi_map,
+                    top_n,
+                    min_score,
+                    weights,
+                );
+
+                SubjectMatchResult {
+                    subject_index: idx,
+                    matches,
+                    candidates_searched: searched,
+                }
+            })
+            .collect()
+    }
+
+    fn score_subjects_sweep(
+        &self,
+        subjects: Vec<BibItemData>,
+        top_n: usize,
+        min_score: f64,
+        weights: &[Weights],
+    ) -> Vec<Vec<SubjectMatchResult>> {
+        let num_candidates = self.candidates.len();
+
+        let per_subject: Vec<(Vec<Vec<MatchResult>>, usize)> = subjects
+            .into_par_iter()
+            .map(|subject| {
+                let candidate_indices =
+                    get_candidate_indices(&subject, &self.index, &self.surnames, num_candidates);
+                let precomputed = PrecomputedItem::new(subject);
+                find_top_matches_indexed_sweep(
+                    &precomputed,
+                    &self.candidates,
+                    &candidate_indices,
+                    &self.doi_map,
+                    top_n,
+                    min_score,
+                    weights,
+                )
+            })
+            .collect();
+
+        // Regroup from per-subject to per-configuration
+        let mut sweeps: Vec<Vec<SubjectMatchResult>> = weights
+            .iter()
+            .map(|_| Vec::with_capacity(per_subject.len()))
+            .collect();
+        for (idx, (matches_per_config, searched)) in per_subject.into_iter().enumerate() {
+            for (sweep, matches) in sweeps.iter_mut().zip(matches_per_config) {
+                sweep.push(SubjectMatchResult {
+                    subject_index: idx,
+                    matches,
+                    candidates_searched: searched,
+                });
+            }
+        }
+        sweeps
+    }
+}
+
+#[pymethods]
+impl CandidateCorpus {
+    #[new]
+    fn new(py: Python<'_>, candidates: Vec<BibItemData>, index: BlockingIndexData) -> Self {
+        py.allow_threads(|| Self::build(candidates, index))
+    }
+
+    fn __len__(&self) -> usize {
+        self.candidates.len()
+    }
 }
 
 /// Batch score with blocking index - filters candidates per subject for massive speedup.
-/// This is the primary entry point for fuzzy matching.
+/// Prepares the candidates on every call; use `score_batch_corpus` to reuse them.
+/// The GIL is released while scoring, so other Python threads keep running.
 #[pyfunction]
 fn score_batch_indexed(
+    py: Python<'_>,
     subjects: Vec<BibItemData>,
     candidates: Vec<BibItemData>,
     index: BlockingIndexData,
@@ -857,47 +1573,43 @@ fn score_batch_indexed(
     min_score: f64,
     weights: Weights,
 ) -> Vec<SubjectMatchResult> {
-    let num_candidates = candidates.len();
-
-    // Build DOI map once for O(1) lookups
-    let doi_map: HashMap<&str, usize> = candidates
-        .iter()
-        .filter_map(|c| {
-            c.doi
-                .as_ref()
-                .filter(|d| !d.is_empty())
-                .map(|d| (d.as_str(), c.index))
-        })
-        .collect();
-
-    subjects
-        .par_iter()
-        .enumerate()
-        .map(|(idx, subject)| {
-            // Precompute subject data once
-            let precomputed = PrecomputedSubject::new(subject);
-
-            // Get filtered candidate indices from blocking index
-            let candidate_indices = get_candidate_indices(subject, &index, num_candidates);
+    py.allow_threads(|| {
+        CandidateCorpus::build(candidates, index)
+            .score_subjects(subjects, top_n, min_score, &weights)
+    })
+}
 
-            // Score only filtered candidates
-            let (matches, searched) = find_top_matches_indexed(
-                &precomputed,
-                &candidates,
-                &candidate_indices,
-                &doi_map,
-                top_n,
-                min_score,
-                &weights,
-            );
+/// Batch score against a prepared `CandidateCorpus`.
+/// This is the primary entry point for fuzzy matching.
+/// The GIL is released while scoring, so other Python threads keep running.
+#[pyfunction]
+fn score_batch_corpus(
+    py: Python<'_>,
+    subjects: Vec<BibItemData>,
+    corpus: &Bound<'_, CandidateCorpus>,
+    top_n: usize,
+    min_score: f64,
+    weights: Weights,
+) -> Vec<SubjectMatchResult> {
+    let corpus = corpus.get();
+    py.allow_threads(|| corpus.score_subjects(subjects, top_n, min_score, &weights))
+}
 
-            SubjectMatchResult {
-                subject_index: idx,
-                matches,
-                candidates_searched: searched,
-            }
-        })
-        .collect()
+/// Batch score against a prepared `CandidateCorpus` for several weight configurations at once.
+/// Each candidate is scored once; returns one result list per weight configuration, each equal to
+/// what `score_batch_corpus` returns for those weights.
+/// The GIL is released while scoring, so other Python threads keep running.
+#[pyfunction]
+fn score_batch_corpus_sweep(
+    py: Python<'_>,
+    subjects: Vec<BibItemData>,
+    corpus: &Bound<'_, CandidateCorpus>,
+    top_n: usize,
+    min_score: f64,
+    weights: Vec<Weights>,
+) -> Vec<Vec<SubjectMatchResult>> {
+    let corpus = corpus.get();
+    py.allow_threads(|| corpus.score_subjects_sweep(subjects, top_n, min_score, &weights))
 }
 
 // === END SCORER FUNCTIONALITY ===
@@ -918,6 +1630,9 @@ fn _rust(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_function(wrap_pyfunction!(token_sort_ratio, m)?)?;
     m.add_function(wrap_pyfunction!(score_batch, m)?)?;
     m.add_function(wrap_pyfunction!(score_batch_indexed, m)?)?;
+    m.add_function(wrap_pyfunction!(score_batch_corpus, m)?)?;
+    m.add_function(wrap_pyfunction!(score_batch_corpus_sweep, m)?)?;
+    m.add_class::<CandidateCorpus>()?;
     Ok(())
 }
 
@@ -954,14 +1669,12 @@ mod tests {
     // Scorer tests (merged from rust_scorer)
     #[test]
     fn test_token_sort_ratio_identical() {
-        let score = token_sort_ratio("hello world", "hello world");
-        assert!((score - 100.0).abs() < 0.001);
+        assert_eq!(token_sort_ratio("hello world", "hello world"), 100.0);
     }
 
     #[test]
     fn test_token_sort_ratio_reordered() {
-        let score = token_sort_ratio("hello world", "world hello");
-        assert!((score - 100.0).abs() < 0.001);
+        assert_eq!(token_sort_ratio("hello world", "world hello"), 100.0);
     }
 
     #[test]
@@ -976,6 +1689,462 @@ mod tests {
         assert!((token_sort_ratio("hello", "") - 0.0).abs() < 0.001);
     }
 
+    #[test]
+    fn test_token_sort_ratio_identical_fast_path() {
+        for s in [
+            "Word and Object",
+            "  spaced   out  ",
+            "über sinn",
+            "   ",
+            "\t",
+        ] {
+            let norm = normalize(s);
+            let slow = if norm.is_empty() {
+                0.0
+            } else {
+                jaro_winkler(&sort_tokens(&norm), &sort_tokens(&norm)) * 100.0
+            };
+            assert_eq!(token_sort_ratio(s, s).to_bits(), slow.to_bits(), "{s:?}");
+        }
+    }
+
+    #[test]
+    fn test_jaro_winkler_matches_strsim() {
+        let long_a =
+            "the logical structure of the world and pseudoproblems in philosophy ".repeat(3);
+        let long_b =
+            "pseudoproblems in philosophy and the logical structure of the world ".repeat(3);
+        let pairs = [
+            ("", ""),
+            ("", "abc"),
+            ("martha", "marhta"),
+            ("dixon", "dicksonx"),
+            ("knowledge and belief", "belief and knowledge"),
+            ("a priori justification", "apriori justification"),
+            ("über sinn und bedeutung", "uber sinn und bedeutung"),
+            (long_a.as_str(), long_b.as_str()),
+            (long_a.as_str(), "the logical structure of the world"),
+        ];
+        for (a, b) in pairs {
+            let expected = strsim::jaro_winkler(a, b);
+            assert_eq!(
+                jaro_winkler(a, b).to_bits(),
+                expected.to_bits(),
+                "{a:?} vs {b:?}"
+            );
+            let expected = strsim::jaro_winkler(b, a);
+            assert_eq!(
+                jaro_winkler(b, a).to_bits(),
+                expected.to_bits(),
+                "{b:?} vs {a:?}"
+            );
+        }
+    }
+
+    #[test]
+    fn test_title_score_upper_bound_holds() {
+        let pairs = [
+            ("knowledge and belief", "belief and knowledge"),
+            ("knowledge", "knowledge and its limits"),
+            ("errata to knowledge and belief", "knowledge and belief"),
+            ("a", "the varieties of reference"),
+            ("word and object", "   "),
+            ("sein und zeit", "quine"),
+            ("ästhetik", "ethik"),
+            ("xyz", "abc"),
+        ];
+        for (a, b) in pairs {
+            let (norm_a, norm_b) = (normalize(a), normalize(b));
+            let (len_a, len_b) = (norm_a.chars().count(), norm_b.chars().count());
+            let common = CharSketch::new(&norm_a)
+                .common_chars(&CharSketch::new(&norm_b))
+                .expect("short titles do not saturate");
+            let bound = title_score_upper_bound(len_a, len_b, common, 0.4);
+            assert!(
+                score_title(a, b, 0.4) <= bound + SCORE_BOUND_SLACK,
+                "{a:?} vs {b:?}"
+            );
+            assert!(bound <= title_score_upper_bound(len_a, len_b, usize::MAX, 0.4));
+        }
+
+        // Titles without a shared character cannot score at all
+        assert_eq!(title_score_upper_bound(3, 3, 0, 0.4), 0.0);
+        assert!(CharSketch::new(&"a".repeat(300)).saturated);
+    }
+
+    #[test]
+    fn test_score_candidate_above_matches_unbounded() {
+        let item = |index: usize, title: &str, author: &str, year: i32| BibItemData {
+            index,
+            title: title.to_string(),
+            author: author.to_string(),
+            year: Some(year),
+            doi: None,
+            journal: None,
+            volume: None,
+            number: None,
+            pages: None,
+            publisher: None,
+        };
+        let weights = Weights {
+            title: 0.4,
+            author: 0.3,
+            date: 0.05,
+            bonus: 0.25,
+        };
+        let precomputed = PrecomputedItem::new(item(
+            0,
+            "Knowledge and Its Limits",
+            "Williamson, Timothy",
+            2000,
+        ));
+        let candidates = [
+            item(1, "Knowledge and its limits", "Timothy Williamson", 2000),
+            item(2, "Reply to Critics", "Williamson, Timothy", 2005),
+            item(3, "An Essay on Free Will", "van Inwagen, Peter", 1983),
+        ]
+        .map(PrecomputedItem::new);
+        for candidate in &candidates {
+            let full = score_candidate_precomputed(&precomputed, candidate, &weights);
+            let bounded = score_candidate_above(&precomputed, candidate, &weights, 0.0)
+                .expect("non-negative scores pass a zero threshold");
+            assert_eq!(bounded.total_score.to_bits(), full.total_score.to_bits());
+            assert!(score_candidate_above(
+                &precomputed,
+                candidate,
+                &weights,
+                full.total_score + 1.0
+            )
+            .is_none());
+        }
+    }
+
+    #[test]
+    fn test_precomputed_scores_match_plain() {
+        let item = |index: usize, title: &str, author: &str, publisher: Option<&str>| BibItemData {
+            index,
+            title: title.to_string(),
+            author: author.to_string(),
+            year: Some(2000),
+            doi: None,
+            journal: None,
+            volume: None,
+            number: None,
+            pages: None,
+            publisher: publisher.map(str::to_string),
+        };
+        let weights = Weights {
+            title: 0.25,
+            author: 0.25,
+            date: 0.2,
+            bonus: 0.3,
+        };
+        let items = [
+            item(
+                0,
+                "Knowledge and Its Limits",
+                "Williamson, Timothy",
+                Some("Oxford University Press"),
+            ),
+            item(
+                1,
+                "its limits  and KNOWLEDGE",
+                "Timothy  Williamson",
+                Some("university press oxford"),
+            ),
+            item(2, "Errata: Knowledge and its limits", "T. Williamson", None),
+            item(3, "", "   ", Some("  ")),
+            item(4, "   ", "E. M. Adams", Some("Blackwell")),
+            item(
+                5,
+                "Review of Word and Object",
+                "Ernest M. Adams",
+                Some("Blackwell"),
+            ),
+        ];
+        let precomputed: Vec<PrecomputedItem> =
+            items.iter().cloned().map(PrecomputedItem::new).collect();
+        for (a, pa) in items.iter().zip(&precomputed) {
+            for (b, pb) in items.iter().zip(&precomputed) {
+                let plain = score_candidate(a, b, &weights);
+                let fast = score_candidate_precomputed(pa, pb, &weights);
+                assert_eq!(
+                    (
+                        fast.title_score.to_bits(),
+                        fast.author_score.to_bits(),
+                        fast.bonus_score.to_bits()
+                    ),
+                    (
+                        plain.title_score.to_bits(),
+                        plain.author_score.to_bits(),
+                        plain.bonus_score.to_bits()
+                    ),
+                    "{:?} vs {:?}",
+                    a.title,
+                    b.title
+                );
+            }
+        }
+    }
+
+    #[test]
+    fn test_take_top_n_orders_by_score_then_index() {
+        let result = |candidate_index: usize, total_score: f64| MatchResult {
+            candidate_index,
+            total_score,
+            title_score: 0.0,
+            author_score: 0.0,
+            date_score: 0.0,
+            bonus_score: 0.0,
+        };
+        let ranked = |results: Vec<MatchResult>, top_n: usize| -> Vec<usize> {
+            take_top_n(results, top_n)
+                .iter()
+                .map(|r| r.candidate_index)
+                .collect()
+        };
+        let scores = [
+            (4, 50.0),
+            (1, 80.0),
+            (7, 50.0),
+            (3, 90.0),
+            (2, 50.0),
+            (0, 10.0),
+        ];
+        let forward: Vec<MatchResult> = scores.iter().map(|&(i, s)| result(i, s)).collect();
+        let backward: Vec<MatchResult> = scores.iter().rev().map(|&(i, s)| result(i, s)).collect();
+
+        assert_eq!(ranked(forward.clone(), 4), vec![3, 1, 2, 4]);
+        assert_eq!(ranked(backward, 4), vec![3, 1, 2, 4]);
+        assert_eq!(ranked(forward.clone(), 10), vec![3, 1, 2, 4, 7, 0]);
+        assert!(ranked(forward, 0).is_empty());
+    }
+
+    #[test]
+    fn test_top_n_collector_matches_take_top_n() {
+        let item = |index: usize, title: &str, author: &str, year: i32| BibItemData {
+            index,
+            title: title.to_string(),
+            author: author.to_string(),
+            year: Some(year),
+            doi: None,
+            journal: None,
+            volume: None,
+            number: None,
+            pages: None,
+            publisher: None,
+        };
+        let subject = PrecomputedItem::new(item(
+            0,
+            "Knowledge and Its Limits",
+            "Williamson, Timothy",
+            2000,
+        ));
+        let candidates: Vec<PrecomputedItem> = [
+            item(0, "An Essay on Free Will", "van Inwagen, Peter", 1983),
+            item(1, "Knowledge and Its Limits", "Smith, John", 1990),
+            item(2, "Reply to Critics", "Williamson, Timothy", 2005),
+            item(3, "Knowledge and its limits", "Timothy Williamson", 2000),
+            item(4, "Knowledge and Its Limits", "Smith, John", 1990),
+            item(5, "Vagueness", "Williamson, Timothy", 1994),
+        ]
+        .into_iter()
+        .map(PrecomputedItem::new)
+        .collect();
+        let weights = Weights {
+            title: 0.5,
+            author: 0.3,
+            date: 0.1,
+            bonus: 0.1,
+        };
+        let indices: Vec<usize> = (0..candidates.len()).collect();
+        let doi_map = HashMap::new();
+
+        for min_score in [0.0, 40.0] {
+            for top_n in 0..=candidates.len() + 1 {
+                let all: Vec<MatchResult> = candidates
+                    .iter()
+                    .map(|c| score_candidate_precomputed(&subject, c, &weights))
+                    .filter(|r| r.total_score >= min_score)
+                    .collect();
+                let (found, _) = find_top_matches_indexed(
+                    &subject,
+                    &candidates,
+                    &indices,
+                    &doi_map,
+                    top_n,
+                    min_score,
+                    &weights,
+                );
+                let key = |r: &MatchResult| (r.candidate_index, r.total_score.to_bits());
+                assert_eq!(
+                    found.iter().map(key).collect::<Vec<_>>(),
+                    take_top_n(all, top_n).iter().map(key).collect::<Vec<_>>(),
+                    "top_n={top_n} min_score={min_score}"
+                );
+            }
+        }
+    }
+
+    #[test]
+    fn test_candidate_indices_are_ascending_union() {
+        let subject = |title: &str, author: &str, year: Option<i32>| BibItemData {
+            index: 0,
+            title: title.to_string(),
+            author: author.to_string(),
+            year,
+            doi: None,
+            journal: None,
+            volume: None,
+            number: None,
+            pages: None,
+            publisher: None,
+        };
+        let postings = |entries: &[(&str, &[usize])]| -> HashMap<String, Vec<usize>> {
+            entries
+                .iter()
+                .map(|&(key, idxs)| (key.to_string(), idxs.to_vec()))
+                .collect()
+        };
+        let index = BlockingIndexData {
+            doi_index: HashMap::new(),
+            trigram_index: postings(&[("abc", &[7, 2]), ("bcd", &[2, 5])]),
+            surname_index: postings(&[("smith", &[5, 1, 42])]),
+            decade_index: [(1990, vec![3, 1])].into_iter().collect(),
+        };
+
+        let surnames = SurnameMatcher::new(&index.surname_index);
+
+        // Shared and out-of-range positions are dropped, the rest comes back in ascending order
+        assert_eq!(
+            get_candidate_indices(
+                &subject("abcd", "John Smith", Some(1995)),
+                &index,
+                &surnames,
+                8
+            ),
+            vec![1, 2, 3, 5, 7]
+        );
+        assert_eq!(
+            get_candidate_indices(&subject("zzz", "Nobody", None), &index, &surnames, 3),
+            vec![0, 1, 2]
+        );
+    }
+
+    #[test]
+    fn test_surname_matcher_matches_substring_search() {
+        let surname_index: HashMap<String, Vec<usize>> = ["ann", "anna", "smith", "nna", "doe"]
+            .iter()
+            .enumerate()
+            .map(|(idx, surname)| (surname.to_string(), vec![idx]))
+            .collect();
+        let matcher = SurnameMatcher::new(&surname_index);
+        assert!(matcher.automaton.is_some());
+
+        for author in [
+            "anna smithson",
+            "j. doe and a. smith",
+            "nobody",
+            "",
+            "annanna",
+        ] {
+            let mut found: Vec<usize> = Vec::new();
+            matcher.for_each_match(author, |idxs| found.extend(idxs));
+            found.sort_unstable();
+            found.dedup();
+
+            let mut expected: Vec<usize> = surname_index
+                .iter()
+                .filter(|(surname, _)| author.contains(surname.as_str()))
+                .flat_map(|(_, idxs)| idxs.iter().copied())
+                .collect();
+            expected.sort_unstable();
+            assert_eq!(found, expected, "author {author:?}");
+        }
+    }
+
+    #[test]
+    fn test_sweep_matches_per_weight_search() {
+        let item = |index: usize, title: &str, author: &str, year: i32| BibItemData {
+            index,
+            title: title.to_string(),
+            author: author.to_string(),
+            year: Some(year),
+            doi: None,
+            journal: None,
+            volume: None,
+            number: None,
+            pages: None,
+            publisher: None,
+        };
+        let subject = PrecomputedItem::new(item(
+            0,
+            "Knowledge and Its Limits",
+            "Williamson, Timothy",
+            2000,
+        ));
+        let candidates: Vec<PrecomputedItem> = [
+            item(0, "Knowledge and its limits", "Timothy Williamson", 2000),
+            item(1, "Reply to Critics", "Williamson, Timothy", 2005),
+            item(2, "An Essay on Free Will", "van Inwagen, Peter", 1983),
+            item(3, "Knowledge and Its Limits", "Smith, John", 1990),
+            item(4, "Knowledge and Its Limits", "Smith, John", 1990),
+        ]
+        .into_iter()
+        .map(PrecomputedItem::new)
+        .collect();
+        let weights = [
+            Weights {
+                title: 0.25,
+                author: 0.25,
+                date: 0.2,
+                bonus: 0.3,
+            },
+            Weights {
+                title: 0.9,
+                author: 0.05,
+                date: 0.025,
+                bonus: 0.025,
+            },
+            Weights {
+                title: 0.05,
+                author: 0.9,
+                date: 0.025,
+                bonus: 0.025,
+            },
+        ];
+        let indices: Vec<usize> = (0..candidates.len()).collect();
+        let doi_map = HashMap::new();
+
+        for min_score in [0.0, 50.0] {
+            let (sweep, _) = find_top_matches_indexed_sweep(
+                &subject,
+                &candidates,
+                &indices,
+                &doi_map,
+                3,
+                min_score,
+                &weights,
+            );
+            for (w, swept) in weights.iter().zip(&sweep) {
+                let (single, _) = find_top_matches_indexed(
+                    &subject,
+                    &candidates,
+                    &indices,
+                    &doi_map,
+                    3,
+                    min_score,
+                    w,
+                );
+                let key = |r: &MatchResult| (r.candidate_index, r.total_score.to_bits());
+                assert_eq!(
+                    swept.iter().map(key).collect::<Vec<_>>(),
+                    single.iter().map(key).collect::<Vec<_>>()
+                );
+            }
+        }
+    }
+
     #[test]
     fn test_score_date_exact() {
         let score = score_date(Some(2020), Some(2020), 1.0);
@@ -1014,6 +2183,19 @@ mod tests {
         assert!(has_academic_prefix("Review of Recent Work"));
         assert!(!has_academic_prefix("On the Nature of Knowledge"));
         assert!(!has_academic_prefix("Knowledge and Belief"));
+        assert!(has_academic_prefix("  Critical Notice: Word and Object"));
+        assert!(has_academic_prefix("PRÉCIS OF Knowledge and Its Limits"));
+    }
+
+    #[test]
+    fn test_max_academic_prefix_chars_covers_all_prefixes() {
+        assert_eq!(
+            ACADEMIC_REVIEW_PREFIXES
+                .iter()
+                .map(|p| p.chars().count())
+                .max(),
+            Some(MAX_ACADEMIC_PREFIX_CHARS)
+        );
     }
 
     // Author initials matching tests
@@ -1,5 +1,6 @@
 """Tests for the fuzzy matcher CLI module."""
 
+import os
 import tempfile
 import time
 from pathlib import Path
@@ -9,6 +10,7 @@ import pytest
 
 from philoch_bib_sdk.logic.default_models import default_bib_item
 from philoch_bib_enhancer.fuzzy_matching.matcher import (
+    BibItemBlockIndex,
     build_index,
     build_index_cached,
     stage_bibitems_batch,
@@ -18,6 +20,7 @@ from philoch_bib_sdk.logic.models import BibItem
 from philoch_bib_enhancer.cli.fuzzy_matcher_cli import (
     _get_str,
     build_plaintext_citation,
+    cache_plaintext_citations,
 )
 
 
@@ -26,7 +29,7 @@ from philoch_bib_enhancer.cli.fuzzy_matcher_cli import (
 # ============================================================================
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_bibliography() -> Tuple[BibItem, ...]:
     """Create a sample bibliography with a few items."""
     return (
@@ -63,7 +66,7 @@ def sample_bibliography() -> Tuple[BibItem, ...]:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_subjects() -> Tuple[BibItem, ...]:
     """Create sample subjects to match against the bibliography."""
     return (
@@ -84,6 +87,12 @@ def sample_subjects() -> Tuple[BibItem, ...]:
     )
 
 
+@pytest.fixture(scope="module")
+def sample_index(sample_bibliography: Tuple[BibItem, ...]) -> BibItemBlockIndex:
+    """Build the index for the sample bibliography once per module."""
+    return build_index(sample_bibliography)
+
+
 # ============================================================================
 # Unit Tests
 # ============================================================================
@@ -181,12 +190,13 @@ class TestBuildIndexCached:
         with tempfile.TemporaryDirectory() as tmpdir:
             cache_path = Path(tmpdir) / "test-index.pkl"
 
-            # First call
+            # First call, then backdate the cache so the rebuild is visible on coarse-mtime filesystems
             build_index_cached(sample_bibliography, cache_path=cache_path)
+            backdated = time.time() - 10
+            os.utime(cache_path, (backdated, backdated))
             first_mtime = cache_path.stat().st_mtime
 
             # Force rebuild
-            time.sleep(0.01)
             build_index_cached(sample_bibliography, cache_path=cache_path, force_rebuild=True)
             second_mtime = cache_path.stat().st_mtime
 
@@ -202,16 +212,13 @@ class TestFuzzyMatchingIntegration:
     """Integration tests for the fuzzy matching pipeline."""
 
     def test_full_matching_pipeline(
-        self, sample_bibliography: Tuple[BibItem, ...], sample_subjects: Tuple[BibItem, ...]
+        self, sample_index: BibItemBlockIndex, sample_subjects: Tuple[BibItem, ...]
     ) -> None:
         """Test the complete matching pipeline."""
-        # Build index
-        index = build_index(sample_bibliography)
-
         # Run matching
         staged = stage_bibitems_batch(
             sample_subjects,
-            index,
+            sample_index,
             top_n=3,
             min_score=0.0,
         )
@@ -240,3 +247,16 @@ class TestFuzzyMatchingIntegration:
             )
 
             assert len(staged) == len(sample_subjects)
+
+    def test_plaintext_citations_cached_for_matches(
+        self, sample_index: BibItemBlockIndex, sample_subjects: Tuple[BibItem, ...]
+    ) -> None:
+        """Test that citations are built only for matched entries."""
+        staged = stage_bibitems_batch(sample_subjects, sample_index, top_n=1)
+
+        plaintext_citations: dict[str, str] = {}
+        for item in staged:
+            cache_plaintext_citations(item, plaintext_citations, top_n=1)
+
+        matched = {item.top_matches[0].bibkey: item.top_matches[0].matched_bibitem for item in staged}
+        assert plaintext_citations == {bibkey: build_plaintext_citation(bib) for bibkey, bib in matched.items()}
@@ -0,0 +1,109 @@
+"""Tests for the shared journal scraping I/O helpers."""
+
+import os
+from pathlib import Path
+from typing import Callable, cast
+
+import pytest
+
+from philoch_bib_sdk.adapters.tabular_data.read_journal_volume_number_index import ColumnNames
+from philoch_bib_sdk.logic.functions.journal_article_matcher import TJournalBibkeyIndex
+
+from philoch_bib_enhancer.cli import journal_scraping_io
+from philoch_bib_enhancer.cli.journal_scraping_io import _index_cache_path, _load_index_cached
+
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+
+COLUMN_NAMES = ColumnNames(bibkey="bibkey", journal="journal", volume="volume", number="number")
+
+
+@pytest.fixture
+def bibliography_path(tmp_path: Path) -> str:
+    path = tmp_path / "bibliography.ods"
+    path.write_bytes(b"ods placeholder")
+    return str(path)
+
+
+@pytest.fixture
+def cache_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    directory = tmp_path / "cache"
+    monkeypatch.setenv("SCRAPE_JOURNAL_CACHE_DIR", str(directory))
+    return directory
+
+
+@pytest.fixture
+def ods_reads(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """Replace the ODS reader with a stub that records each parsed path."""
+    reads: list[str] = []
+
+    def fake_hof_read_from_ods(column_names: ColumnNames) -> Callable[[str], TJournalBibkeyIndex]:
+        def read(path: str) -> TJournalBibkeyIndex:
+            reads.append(path)
+            return cast(TJournalBibkeyIndex, {("Philosophy Today", "10", "2"): f"key-{len(reads)}"})
+
+        return read
+
+    monkeypatch.setattr(journal_scraping_io, "hof_read_from_ods", fake_hof_read_from_ods)
+    return reads
+
+
+def _bump_mtime(path: str) -> None:
+    mtime = os.path.getmtime(path) + 10
+    os.utime(path, (mtime, mtime))
+
+
+# ============================================================================
+# Bibkey index cache
+# ============================================================================
+
+
+class TestLoadIndexCached:
+    def test_cache_hit_skips_ods_parse(self, bibliography_path: str, cache_dir: Path, ods_reads: list[str]) -> None:
+        first = _load_index_cached(bibliography_path, COLUMN_NAMES)
+        second = _load_index_cached(bibliography_path, COLUMN_NAMES)
+
+        assert ods_reads == [bibliography_path]
+        assert second == first
+        assert _index_cache_path(bibliography_path, COLUMN_NAMES).exists()
+
+    def test_mtime_change_invalidates_and_removes_stale_cache(
+        self, bibliography_path: str, cache_dir: Path, ods_reads: list[str]
+    ) -> None:
+        _load_index_cached(bibliography_path, COLUMN_NAMES)
+        old_cache = _index_cache_path(bibliography_path, COLUMN_NAMES)
+
+        _bump_mtime(bibliography_path)
+        rebuilt = _load_index_cached(bibliography_path, COLUMN_NAMES)
+        new_cache = _index_cache_path(bibliography_path, COLUMN_NAMES)
+
+        assert len(ods_reads) == 2
+        assert list(rebuilt.values()) == ["key-2"]
+        assert new_cache != old_cache
+        assert sorted(cache_dir.iterdir()) == [new_cache]
+
+    def test_corrupt_cache_is_rebuilt(self, bibliography_path: str, cache_dir: Path, ods_reads: list[str]) -> None:
+        cache_path = _index_cache_path(bibliography_path, COLUMN_NAMES)
+        cache_dir.mkdir(parents=True)
+        cache_path.write_bytes(b"not a pickle")
+
+        index = _load_index_cached(bibliography_path, COLUMN_NAMES)
+
+        assert len(ods_reads) == 1
+        assert list(index.values()) == ["key-1"]
+        assert _load_index_cached(bibliography_path, COLUMN_NAMES) == index
+        assert len(ods_reads) == 1
+
+    def test_unwritable_cache_dir_still_returns_index(
+        self, bibliography_path: str, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, ods_reads: list[str]
+    ) -> None:
+        blocker = tmp_path / "not-a-directory"
+        blocker.write_bytes(b"")
+        monkeypatch.setenv("SCRAPE_JOURNAL_CACHE_DIR", str(blocker / "cache"))
+
+        index = _load_index_cached(bibliography_path, COLUMN_NAMES)
+
+        assert list(index.values()) == ["key-1"]
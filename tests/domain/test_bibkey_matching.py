@@ -0,0 +1,54 @@
+"""Tests for bibkey matching domain logic."""
+
+import attrs
+import pytest
+
+from philoch_bib_sdk.logic.default_models import default_bib_item
+from philoch_bib_sdk.logic.models import BibItem, BibKeyAttr
+
+from philoch_bib_enhancer.domain.bibkey_matching import _evolve_bibkey
+
+
+@pytest.fixture
+def populated_item() -> BibItem:
+    return default_bib_item(
+        entry_type="article",
+        bibkey={"first_author": "Smith", "date": 2024},
+        author=(
+            {"given_name": {"latex": "John"}, "family_name": {"latex": "Smith"}},
+            {"given_name": {"latex": "Jane"}, "family_name": {"latex": "Doe"}},
+        ),
+        date={"year": 2024},
+        title={"latex": "Introduction to Philosophy", "simplified": "Introduction to Philosophy"},
+        journal={"name": {"latex": "Philosophy Today"}, "issn_print": "1234-5678", "issn_electronic": "8765-4321"},
+        volume="10",
+        number="2",
+        pages=({"start": "1", "end": "20"},),
+        publisher={"latex": "Academic Press"},
+        doi="10.1234/example",
+        url="https://example.org/article",
+        _bib_info_source="Crossref",
+    )
+
+
+@pytest.fixture
+def other_bibkey() -> BibKeyAttr:
+    bibkey = default_bib_item(bibkey={"first_author": "Doe", "date": 2023}).bibkey
+    assert isinstance(bibkey, BibKeyAttr)
+    return bibkey
+
+
+class TestEvolveBibkey:
+    def test_matches_attrs_evolve(self, populated_item: BibItem, other_bibkey: BibKeyAttr) -> None:
+        evolved = _evolve_bibkey(populated_item, other_bibkey)
+        expected = attrs.evolve(populated_item, bibkey=other_bibkey)
+        assert evolved == expected
+        for field in attrs.fields(BibItem):
+            assert getattr(evolved, field.name) == getattr(expected, field.name), field.name
+
+    def test_returns_new_item(self, populated_item: BibItem, other_bibkey: BibKeyAttr) -> None:
+        original_bibkey = populated_item.bibkey
+        evolved = _evolve_bibkey(populated_item, other_bibkey)
+        assert evolved is not populated_item
+        assert evolved.bibkey == other_bibkey
+        assert populated_item.bibkey == original_bibkey
@@ -221,3 +221,65 @@ def bib_author_strong() -> BibItem:
 def weight_test_bibliography(bib_title_strong: BibItem, bib_author_strong: BibItem) -> Tuple[BibItem, ...]:
     """Bibliography with two items designed to test weight behavior."""
     return (bib_title_strong, bib_author_strong)
+
+
+# Bonus-field subjects are never mutated by the tests that use them, so they are built once per module.
+
+
+@pytest.fixture(scope="module")
+def subject_doi_only() -> BibItem:
+    """Subject sharing only the DOI with Smith's philosophy article."""
+    return default_bib_item(
+        bibkey={"first_author": "X", "date": 2024},
+        title={"latex": "Anything"},
+        entry_type="article",
+        doi="10.1234/phil.2024.001",
+    )
+
+
+@pytest.fixture(scope="module")
+def subject_journal_vol_num() -> BibItem:
+    """Subject sharing only journal, volume and number with Smith's philosophy article."""
+    return default_bib_item(
+        bibkey={"first_author": "X", "date": 2024},
+        title={"latex": "Anything"},
+        entry_type="article",
+        journal={"name": {"simplified": "Philosophy Today"}},
+        volume="10",
+        number="2",
+    )
+
+
+@pytest.fixture(scope="module")
+def subject_pages() -> BibItem:
+    """Subject sharing only the pages with Smith's philosophy article."""
+    return default_bib_item(
+        bibkey={"first_author": "X", "date": 2024},
+        title={"latex": "Anything"},
+        entry_type="article",
+        pages=({"start": "1", "end": "25"},),
+    )
+
+
+@pytest.fixture(scope="module")
+def subject_publisher() -> BibItem:
+    """Subject sharing only the publisher with Smith's philosophy article."""
+    return default_bib_item(
+        bibkey={"first_author": "X", "date": 2024},
+        title={"latex": "Anything"},
+        entry_type="article",
+        publisher={"simplified": "Academic Press"},
+    )
+
+
+@pytest.fixture(scope="module")
+def subject_combined_bonuses() -> BibItem:
+    """Subject sharing DOI, pages and publisher with Smith's philosophy article."""
+    return default_bib_item(
+        bibkey={"first_author": "X", "date": 2024},
+        title={"latex": "Anything"},
+        entry_type="article",
+        doi="10.1234/phil.2024.001",
+        pages=({"start": "1", "end": "25"},),
+        publisher={"simplified": "Academic Press"},
+    )
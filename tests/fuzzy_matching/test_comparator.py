@@ -257,49 +257,23 @@ class TestScoreDateDetailed:
 
 
 class TestScoreBonusFields:
-    def test_doi_exact_match(self, bib_smith_philosophy: BibItem) -> None:
-        subject = default_bib_item(
-            bibkey={"first_author": "X", "date": 2024},
-            title={"latex": "Anything"},
-            entry_type="article",
-            doi="10.1234/phil.2024.001",
-        )
-        result = _score_bonus_fields(bib_smith_philosophy, subject)
+    def test_doi_exact_match(self, bib_smith_philosophy: BibItem, subject_doi_only: BibItem) -> None:
+        result = _score_bonus_fields(bib_smith_philosophy, subject_doi_only)
         assert result.score >= 100
         assert "DOI" in result.details
 
-    def test_journal_volume_number_match(self, bib_smith_philosophy: BibItem) -> None:
-        subject = default_bib_item(
-            bibkey={"first_author": "X", "date": 2024},
-            title={"latex": "Anything"},
-            entry_type="article",
-            journal={"name": {"simplified": "Philosophy Today"}},
-            volume="10",
-            number="2",
-        )
-        result = _score_bonus_fields(bib_smith_philosophy, subject)
+    def test_journal_volume_number_match(self, bib_smith_philosophy: BibItem, subject_journal_vol_num: BibItem) -> None:
+        result = _score_bonus_fields(bib_smith_philosophy, subject_journal_vol_num)
         assert result.score >= 50
         assert "Journal" in result.details or "Vol" in result.details
 
-    def test_pages_match(self, bib_smith_philosophy: BibItem) -> None:
-        subject = default_bib_item(
-            bibkey={"first_author": "X", "date": 2024},
-            title={"latex": "Anything"},
-            entry_type="article",
-            pages=({"start": "1", "end": "25"},),
-        )
-        result = _score_bonus_fields(bib_smith_philosophy, subject)
+    def test_pages_match(self, bib_smith_philosophy: BibItem, subject_pages: BibItem) -> None:
+        result = _score_bonus_fields(bib_smith_philosophy, subject_pages)
         assert result.score >= 20
         assert "Page" in result.details or "page" in result.details
 
-    def test_publisher_match(self, bib_smith_philosophy: BibItem) -> None:
-        subject = default_bib_item(
-            bibkey={"first_author": "X", "date": 2024},
-            title={"latex": "Anything"},
-            entry_type="article",
-            publisher={"simplified": "Academic Press"},
-        )
-        result = _score_bonus_fields(bib_smith_philosophy, subject)
+    def test_publisher_match(self, bib_smith_philosophy: BibItem, subject_publisher: BibItem) -> None:
+        result = _score_bonus_fields(bib_smith_philosophy, subject_publisher)
         assert result.score >= 10
         assert "Publisher" in result.details or "publisher" in result.details
 
@@ -310,17 +284,9 @@ class TestScoreBonusFields:
         assert result.score == 0
         assert "No bonus" in result.details
 
-    def test_combined_bonuses(self, bib_smith_philosophy: BibItem) -> None:
+    def test_combined_bonuses(self, bib_smith_philosophy: BibItem, subject_combined_bonuses: BibItem) -> None:
         """Subject matching on DOI + pages + publisher should accumulate."""
-        subject = default_bib_item(
-            bibkey={"first_author": "X", "date": 2024},
-            title={"latex": "Anything"},
-            entry_type="article",
-            doi="10.1234/phil.2024.001",
-            pages=({"start": "1", "end": "25"},),
-            publisher={"simplified": "Academic Press"},
-        )
-        result = _score_bonus_fields(bib_smith_philosophy, subject)
+        result = _score_bonus_fields(bib_smith_philosophy, subject_combined_bonuses)
         # DOI(100) + Pages(20) + Publisher(10) = 130
         assert result.score >= 130
 
@@ -14,6 +14,7 @@ from philoch_bib_enhancer.fuzzy_matching.matcher import (
     _get_decade,
     build_index,
     stage_bibitems_batch,
+    stage_bibitems_weight_sweep,
 )
 from philoch_bib_enhancer.fuzzy_matching.models import (
     BibItemStaged,
@@ -121,7 +122,7 @@ class TestBuildIndex:
     def test_doi_index_populated(self, bib_smith_philosophy: BibItem) -> None:
         index = build_index((bib_smith_philosophy,))
         assert "10.1234/phil.2024.001" in index.doi_index
-        assert index.doi_index["10.1234/phil.2024.001"] is bib_smith_philosophy
+        assert index.all_items[index.doi_index["10.1234/phil.2024.001"]] is bib_smith_philosophy
 
     def test_title_trigrams_populated(self, bib_smith_philosophy: BibItem) -> None:
         index = build_index((bib_smith_philosophy,))
@@ -132,12 +133,24 @@ class TestBuildIndex:
     def test_author_surnames_populated(self, bib_smith_philosophy: BibItem) -> None:
         index = build_index((bib_smith_philosophy,))
         assert "smith" in index.author_surnames
-        assert bib_smith_philosophy in index.author_surnames["smith"]
+        assert list(index.author_surnames["smith"]) == [0]
 
     def test_year_decades_populated(self, bib_smith_philosophy: BibItem) -> None:
         index = build_index((bib_smith_philosophy,))
         assert 2020 in index.year_decades
-        assert bib_smith_philosophy in index.year_decades[2020]
+        assert list(index.year_decades[2020]) == [0]
+
+    def test_postings_are_ascending_positions(self, sample_bibliography: Tuple[BibItem, ...]) -> None:
+        index = build_index(sample_bibliography)
+        for postings in (index.title_trigrams, index.author_surnames, index.year_decades, index.journals):
+            for positions in postings.values():
+                assert list(positions) == sorted(set(positions))
+                assert all(0 <= idx < len(sample_bibliography) for idx in positions)
+
+    def test_identical_postings_are_shared(self, bib_smith_philosophy: BibItem) -> None:
+        index = build_index((bib_smith_philosophy,))
+        postings = [*index.title_trigrams.values(), *index.author_surnames.values(), *index.year_decades.values()]
+        assert all(p is postings[0] for p in postings)
 
     def test_journal_index_populated(self, bib_smith_philosophy: BibItem) -> None:
         index = build_index((bib_smith_philosophy,))
@@ -164,7 +177,7 @@ class TestGetCandidateSet:
         index = build_index(sample_bibliography)
         candidates = _get_candidate_set(subject_exact_match, index)
         assert len(candidates) == 1
-        assert bib_smith_philosophy in candidates
+        assert index.all_items[candidates[0]] is bib_smith_philosophy
 
     def test_no_doi_returns_multiple_candidates(
         self,
@@ -175,6 +188,7 @@ class TestGetCandidateSet:
         candidates = _get_candidate_set(subject_close_match, index)
         # Should find candidates via trigrams/author/decade
         assert len(candidates) >= 1
+        assert list(candidates) == sorted(set(candidates))
 
     def test_unknown_item_falls_back_to_all(self) -> None:
         bib = (
@@ -305,3 +319,37 @@ class TestWeightsBehavior:
         staged_author = stage_bibitems_batch((subject_close_match,), index, top_n=2, weights=author_heavy)
 
         assert staged_title[0].top_matches[0].matched_bibitem is not staged_author[0].top_matches[0].matched_bibitem
+
+
+# ============================================================================
+# stage_bibitems_weight_sweep tests
+# ============================================================================
+
+
+class TestStageBibitemsWeightSweep:
+    def test_sweep_matches_batch_per_config(
+        self,
+        weight_test_bibliography: Tuple[BibItem, ...],
+        subject_close_match: BibItem,
+    ) -> None:
+        """Each configuration of a sweep ranks exactly like a separate batch call."""
+        title_heavy: FuzzyMatchWeights = {"title": 0.9, "author": 0.05, "date": 0.025, "bonus": 0.025}
+        author_heavy: FuzzyMatchWeights = {"title": 0.05, "author": 0.9, "date": 0.025, "bonus": 0.025}
+        index = build_index(weight_test_bibliography)
+
+        sweep = stage_bibitems_weight_sweep((subject_close_match,), index, (title_heavy, author_heavy), top_n=2)
+
+        assert len(sweep) == 2
+        for staged, weights in zip(sweep, (title_heavy, author_heavy)):
+            expected = stage_bibitems_batch((subject_close_match,), index, top_n=2, weights=weights)
+            assert [(m.matched_bibitem, m.total_score) for m in staged[0].top_matches] == [
+                (m.matched_bibitem, m.total_score) for m in expected[0].top_matches
+            ]
+
+    def test_empty_sweep(
+        self,
+        sample_bibliography: Tuple[BibItem, ...],
+        subject_close_match: BibItem,
+    ) -> None:
+        index = build_index(sample_bibliography)
+        assert stage_bibitems_weight_sweep((subject_close_match,), index, ()) == ()
@@ -1,8 +1,8 @@
 """Tests for Rust/Python scorer parity.
 
-These tests verify that the Rust and Python scoring paths produce
-consistent results. Note: the algorithms differ slightly (Rust uses
-Jaro-Winkler via strsim, Python uses token_sort_ratio from fuzzywuzzy),
+These tests verify that the Rust scorer, the only staging path, produces
+consistent results. Note: its token_sort_ratio is Jaro-Winkler on sorted
+tokens rather than the fuzzy_match_score used by the Python comparator,
 so we test for agreement on ranking rather than exact score equality.
 """
 
@@ -10,18 +10,18 @@ from typing import Tuple
 
 import pytest
 
+_rust = pytest.importorskip("philoch_bib_enhancer._rust", reason="Rust scorer not available")
+
 from philoch_bib_sdk.logic.default_models import default_bib_item
 from philoch_bib_sdk.logic.models import BibItem
 
 from philoch_bib_enhancer.fuzzy_matching.matcher import (
-    _RUST_SCORER_AVAILABLE,
+    BibItemBlockIndex,
     build_index,
     stage_bibitems_batch,
 )
 from philoch_bib_enhancer.fuzzy_matching.models import FuzzyMatchWeights
 
-pytestmark = pytest.mark.skipif(not _RUST_SCORER_AVAILABLE, reason="Rust scorer not available")
-
 
 # ============================================================================
 # token_sort_ratio parity
@@ -30,27 +30,17 @@ pytestmark = pytest.mark.skipif(not _RUST_SCORER_AVAILABLE, reason="Rust scorer
 
 class TestTokenSortRatio:
     def test_identical_strings(self) -> None:
-        from philoch_bib_enhancer._rust import token_sort_ratio
-
-        score = token_sort_ratio("hello world", "hello world")
-        assert abs(score - 100.0) < 0.001
+        assert _rust.token_sort_ratio("hello world", "hello world") == 100.0
 
     def test_reordered_tokens(self) -> None:
-        from philoch_bib_enhancer._rust import token_sort_ratio
-
-        score = token_sort_ratio("hello world", "world hello")
-        assert abs(score - 100.0) < 0.001
+        assert _rust.token_sort_ratio("hello world", "world hello") == 100.0
 
     def test_empty_string(self) -> None:
-        from philoch_bib_enhancer._rust import token_sort_ratio
-
-        assert token_sort_ratio("", "hello") == 0.0
-        assert token_sort_ratio("hello", "") == 0.0
+        assert _rust.token_sort_ratio("", "hello") == 0.0
+        assert _rust.token_sort_ratio("hello", "") == 0.0
 
     def test_similar_strings_nonzero(self) -> None:
-        from philoch_bib_enhancer._rust import token_sort_ratio
-
-        score = token_sort_ratio("Introduction to Philosophy", "Intro to Philosophy")
+        score = _rust.token_sort_ratio("Introduction to Philosophy", "Intro to Philosophy")
         assert score > 50.0
 
 
@@ -60,7 +50,7 @@ class TestTokenSortRatio:
 
 
 class TestRustPythonParity:
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def bibliography(self) -> Tuple[BibItem, ...]:
         return (
             default_bib_item(
@@ -94,7 +84,7 @@ class TestRustPythonParity:
             ),
         )
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def subjects(self) -> Tuple[BibItem, ...]:
         return (
             default_bib_item(
@@ -113,39 +103,38 @@ class TestRustPythonParity:
             ),
         )
 
-    def test_returns_correct_count(self, bibliography: Tuple[BibItem, ...], subjects: Tuple[BibItem, ...]) -> None:
-        index = build_index(bibliography)
+    @pytest.fixture(scope="class")
+    def index(self, bibliography: Tuple[BibItem, ...]) -> BibItemBlockIndex:
+        return build_index(bibliography)
+
+    def test_returns_correct_count(self, index: BibItemBlockIndex, subjects: Tuple[BibItem, ...]) -> None:
         results = stage_bibitems_batch(subjects, index, top_n=3)
         assert len(results) == len(subjects)
 
-    def test_top1_match_exists(self, bibliography: Tuple[BibItem, ...], subjects: Tuple[BibItem, ...]) -> None:
+    def test_top1_match_exists(self, index: BibItemBlockIndex, subjects: Tuple[BibItem, ...]) -> None:
         """Rust scorer should return at least one match for each subject."""
-        index = build_index(bibliography)
         results = stage_bibitems_batch(subjects, index, top_n=1)
 
         for staged in results:
             assert len(staged.top_matches) >= 1
             assert staged.top_matches[0].bibkey
 
-    def test_scores_are_non_negative(self, bibliography: Tuple[BibItem, ...], subjects: Tuple[BibItem, ...]) -> None:
+    def test_scores_are_non_negative(self, index: BibItemBlockIndex, subjects: Tuple[BibItem, ...]) -> None:
         """Rust scorer should produce non-negative scores."""
-        index = build_index(bibliography)
         results = stage_bibitems_batch(subjects, index, top_n=3)
 
         for staged in results:
             for match in staged.top_matches:
                 assert match.total_score >= 0
 
-    def test_custom_weights_work(self, bibliography: Tuple[BibItem, ...], subjects: Tuple[BibItem, ...]) -> None:
+    def test_custom_weights_work(self, index: BibItemBlockIndex, subjects: Tuple[BibItem, ...]) -> None:
         """Custom weights should work with Rust scorer."""
-        index = build_index(bibliography)
         weights: FuzzyMatchWeights = {"title": 0.7, "author": 0.1, "date": 0.1, "bonus": 0.1}
         results = stage_bibitems_batch(subjects, index, top_n=2, weights=weights)
         assert len(results) == len(subjects)
 
-    def test_rust_scorer_metadata(self, bibliography: Tuple[BibItem, ...], subjects: Tuple[BibItem, ...]) -> None:
+    def test_rust_scorer_metadata(self, index: BibItemBlockIndex, subjects: Tuple[BibItem, ...]) -> None:
         """Rust scorer should report 'rust_indexed' in metadata."""
-        index = build_index(bibliography)
         results = stage_bibitems_batch(subjects, index, top_n=2)
 
         for staged in results: